@@ -1,13 +1,17 @@
+import asyncio
+from operator import itemgetter
+
 from discord.ext import commands
 from discord import app_commands, Interaction, File
 from datetime import datetime
 
+from app.helper import deferred_command
 from voxlib.rendering import render_session
 from voxlib.database.utils import Sessions
+from voxlib.api.utils import PlayerInfo
 from voxlib import (
-    check_if_linked_discord, 
-    fetch_player,
-    DIR
+    check_if_linked_discord,
+    fetch_player
 )
 
 
@@ -31,38 +35,26 @@ class Session(commands.Cog):
         app_commands.Choice(name="2", value=2),
         app_commands.Choice(name="3", value=3),
     ])
+    @deferred_command
     async def start_session(self, interaction: Interaction, session: int):
-        try:
-            await interaction.response.defer()
-            if not (uuid := await check_if_linked_discord(
-                interaction, 'You must have an account linked to use this command.')
-            ):
-                return None
-
-            session_stats = Sessions(uuid, session).get_session()
-            if session_stats:
-                return await interaction.edit_original_response(
-                    content=f'This session is already active, if you want to end this session run the `/session end` command.'
-                )
-            
-            try:
-                await Sessions(uuid, session).create_session()
-                return await interaction.edit_original_response(
-                    content=f'A new session was successfully created with Session ID: **{session}**.'
-                )
-            except Exception as error:
-                print(error)
-
-        except Exception as error:
-            print(error)
-            await interaction.edit_original_response(
-                content=(
-                    "Something went wrong. If this issue persists, please contact "
-                    "the **VoxStats Dev Team.** for more information."
-                )
-            )
+        if not (uuid := await check_if_linked_discord(
+            interaction, 'You must have an account linked to use this command.')
+        ):
             return None
 
+        sess = Sessions(uuid, session)
+
+        session_stats = await sess.get_session()
+        if session_stats:
+            return await interaction.edit_original_response(
+                content=f'This session is already active, if you want to end this session run the `/session end` command.'
+            )
+
+        await sess.create_session()
+        return await interaction.edit_original_response(
+            content=f'A new session was successfully created with Session ID: **{session}**.'
+        )
+
 
     @session.command(name="end", description="Ends a session")
     @app_commands.describe(session="The session you want to end")
@@ -71,35 +63,26 @@ class Session(commands.Cog):
         app_commands.Choice(name="2", value=2),
         app_commands.Choice(name="3", value=3),
     ])
+    @deferred_command
     async def end_session(self, interaction: Interaction, session: int):
-        try:
-            await interaction.response.defer()
-            if not (uuid := await check_if_linked_discord(
-                interaction, 'You must have an account linked to use this command.')
-            ):
-                return None
-
-            session_stats = Sessions(uuid, session).get_session()
-            if session_stats:
-                Sessions(uuid, session).end_session()
-                return await interaction.edit_original_response(
-                    content=f'Session **{session}** has been deleted successfully.'
-                )
-            else:
-                return await interaction.edit_original_response(
-                    content=f"You don't have an active session with session ID: **{session}**."
-                )                
-
-        except Exception as error:
-            print(error)
-            await interaction.edit_original_response(
-                content=(
-                    "Something went wrong. If this issue persists, please contact "
-                    "the **VoxStats Dev Team.** for more information."
-                )
-            )
+        if not (uuid := await check_if_linked_discord(
+            interaction, 'You must have an account linked to use this command.')
+        ):
             return None
 
+        sess = Sessions(uuid, session)
+
+        session_stats = await sess.get_session()
+        if session_stats:
+            await sess.end_session()
+            return await interaction.edit_original_response(
+                content=f'Session **{session}** has been deleted successfully.'
+            )
+        else:
+            return await interaction.edit_original_response(
+                content=f"You don't have an active session with session ID: **{session}**."
+            )
+
 
     @session.command(name="reset",description="Resets a session")
     @app_commands.describe(session="The session you want to reset")
@@ -108,66 +91,47 @@ class Session(commands.Cog):
         app_commands.Choice(name="2", value=2),
         app_commands.Choice(name="3", value=3),
     ])
+    @deferred_command
     async def reset_session(self, interaction: Interaction, session: int):
-        try:
-            await interaction.response.defer()
-            if not (uuid := await check_if_linked_discord(
-                interaction, 'You must have an account linked to use this command.')
-            ):
-                return None      
-
-            session_stats = Sessions(uuid, session).get_session()
-            if session_stats:
-                await Sessions(uuid, session).reset_session()
-                return await interaction.edit_original_response(
-                    content=f'Session **{session}** has been reset successfully.'
-                ) 
-            else:
-                return await interaction.edit_original_response(
-                    content=f"You don't have an active session with session ID: **{session}**."
-                )
-            
-        except Exception as error:
-            print(error)
-            await interaction.edit_original_response(
-                content=(
-                    "Something went wrong. If this issue persists, please contact "
-                    "the **VoxStats Dev Team.** for more information."
-                )
-            )
+        if not (uuid := await check_if_linked_discord(
+            interaction, 'You must have an account linked to use this command.')
+        ):
             return None
-         
+
+        sess = Sessions(uuid, session)
+
+        session_stats = await sess.get_session()
+        if session_stats:
+            await sess.reset_session()
+            return await interaction.edit_original_response(
+                content=f'Session **{session}** has been reset successfully.'
+            )
+        else:
+            return await interaction.edit_original_response(
+                content=f"You don't have an active session with session ID: **{session}**."
+            )
+
 
     @session.command(name="active", description="View the active sessions")
+    @deferred_command
     async def active_sessions(self, interaction: Interaction):
-        try:
-            await interaction.response.defer()
-            if not (uuid := await check_if_linked_discord(
-                interaction, 'You must have an account linked to use this command.')
-            ):
-                return None             
-
-            active_sessions = Sessions(uuid).get_active_sessions()
-            if active_sessions:
-                sessions = ", ".join(str(item[0]) for item in sorted(active_sessions))
-                return await interaction.edit_original_response(
-                    content=f"Your active sessions: **{sessions}**"
-                )
-            else:
-                return await interaction.edit_original_response(
-                    content=f"You don't have any sessions active! Use `/session start` to create one."
-                )                
-
-        except Exception as error:
-            print(error)
-            await interaction.edit_original_response(
-                content=(
-                    "Something went wrong. If this issue persists, please contact "
-                    "the **VoxStats Dev Team.** for more information."
-                )
-            )
+        if not (uuid := await check_if_linked_discord(
+            interaction, 'You must have an account linked to use this command.')
+        ):
             return None
 
+        active_sessions = await Sessions(uuid).get_active_sessions()
+        if active_sessions:
+            ids = sorted(map(itemgetter(0), active_sessions))
+            sessions = ", ".join(map(str, ids))
+            return await interaction.edit_original_response(
+                content=f"Your active sessions: **{sessions}**"
+            )
+        else:
+            return await interaction.edit_original_response(
+                content=f"You don't have any sessions active! Use `/session start` to create one."
+            )
+
 
     @session.command(name="view", description="View the session of a player")
     @app_commands.describe(
@@ -179,40 +143,39 @@ class Session(commands.Cog):
         app_commands.Choice(name="2", value=2),
         app_commands.Choice(name="3", value=3),
     ])
+    @deferred_command
     async def view_session(self, interaction: Interaction, player: str = None, session: int = 1):
-        try:
-            await interaction.response.defer()
-
-            if not (uuid := await fetch_player(interaction, player)):
-                return None
-            
-            sessions = Sessions(uuid, session).get_session()
-            if not sessions:
-                await Sessions(uuid, session).create_session()
-                return await interaction.edit_original_response(
-                    content=
-                        f"This player has no active session with session ID: **{session}**\n"
-                        f"I have created a new session for this player with session ID: **{session}**"
-                )   
-            if session:
-                await render_session(uuid, session)
-                await interaction.edit_original_response(
-                    attachments=[File(f"{DIR}assets/stats/session.png")]
-                )
-            else:
-                return await interaction.edit_original_response(
-                    content=f"You don't have an active session with ID: **{session}**"
-                )                
-
-        except Exception as error:
-            print(error)
+        if not (uuid := await fetch_player(interaction, player)):
+            return None
+
+        # Warm the API cache with the stats render_session needs while
+        # the session row is looked up, instead of paying both in series.
+        sess = Sessions(uuid, session)
+        prefetch = PlayerInfo(uuid)
+        sessions, _ = await asyncio.gather(
+            sess.get_session(),
+            asyncio.gather(
+                prefetch.fetch_overall_stats(),
+                prefetch.fetch_game_stats(),
+                return_exceptions=True
+            )
+        )
+        if not sessions:
+            await sess.create_session()
+            return await interaction.edit_original_response(
+                content=
+                    f"This player has no active session with session ID: **{session}**\n"
+                    f"I have created a new session for this player with session ID: **{session}**"
+            )
+        if session:
+            buffer = await render_session(uuid, session)
             await interaction.edit_original_response(
-                content=(
-                    "Something went wrong. If this issue persists, please contact "
-                    "the **VoxStats Dev Team.** for more information."
-                )
+                attachments=[File(buffer, filename="session.png")]
+            )
+        else:
+            return await interaction.edit_original_response(
+                content=f"You don't have an active session with ID: **{session}**"
             )
-            return None
 
 async def setup(client: commands.Bot) -> None:
-    await client.add_cog(Session(client))
\ No newline at end of file
+    await client.add_cog(Session(client))
@@ -1,5 +1,10 @@
 from .client import Client
+from .decorators import deferred_command
+from .errors import report, GENERIC_ERROR_MSG
 
 __all__ = [
-    "Client"
+    "Client",
+    "deferred_command",
+    "report",
+    "GENERIC_ERROR_MSG"
 ]
\ No newline at end of file
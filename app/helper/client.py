@@ -1,7 +1,12 @@
 import os
+import asyncio
+
 import discord
 from discord.ext import commands
 
+from voxlib.api import API
+from voxlib.api.dedupe import bulk_resolver
+
 intents = discord.Intents.all()
 intents.message_content = True
 
@@ -15,15 +20,33 @@ class Client(commands.AutoShardedBot):
         )
 
     async def setup_hook(self):
-        for folder in os.listdir("app/cogs"):
-            for cog in os.listdir(f"app/cogs/{folder}"):
-                if cog.endswith(".py"):
-                    try:
-                        await self.load_extension(name=f"app.cogs.{folder}.{cog[:-3]}")
-                        print(f"Loaded: {cog[:-3]} cog")
-
-                    except commands.errors.ExtensionNotFound:
-                        print(f"Failed to load {cog[:-3]}")
+        names = []
+        with os.scandir("app/cogs") as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                with os.scandir(folder.path) as cogs:
+                    names.extend(
+                        f"app.cogs.{folder.name}.{cog.name[:-3]}"
+                        for cog in cogs
+                        if cog.is_file() and cog.name.endswith(".py")
+                    )
+
+        results = await asyncio.gather(
+            *(self.load_extension(name=name) for name in names),
+            return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            cog = name.rsplit('.', 1)[-1]
+            if isinstance(result, Exception):
+                print(f"Failed to load {cog}: {result!r}")
+            else:
+                print(f"Loaded: {cog} cog")
+
+    async def close(self):
+        await API.close()
+        await bulk_resolver.close()
+        await super().close()
 
     async def on_ready(self):
         print(f'Logged in as {self.user} (ID: {self.user.id})\n{50 * "-"}')
@@ -0,0 +1,42 @@
+import functools
+import logging
+import time
+
+from discord import Interaction
+
+from .errors import report
+
+logger = logging.getLogger(__name__)
+
+
+def deferred_command(func):
+    """
+    Decorator for slash command callbacks that defers the interaction
+    before any other work runs.
+
+    Deferring first guarantees the 3-second acknowledgement window is met
+    even when the database or the Voxyl API is slow. The decorator also
+    logs the total command latency and handles unexpected errors uniformly,
+    replacing the per-command try/except blocks.
+
+    Args:
+        func (Coroutine): The command callback to wrap.
+
+    Returns:
+        Coroutine: Wrapped callback with deferral, timing, and error handling.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction: Interaction, *args, **kwargs):
+        start = time.perf_counter()
+        await interaction.response.defer()
+
+        try:
+            return await func(self, interaction, *args, **kwargs)
+        except Exception as error:
+            await report(interaction, error)
+            return None
+        finally:
+            total = (time.perf_counter() - start) * 1000
+            logger.info("/%s: total=%.0fms", func.__name__, total)
+
+    return wrapper
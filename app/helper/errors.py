@@ -0,0 +1,26 @@
+import logging
+
+from discord import Interaction
+
+logger = logging.getLogger(__name__)
+
+
+GENERIC_ERROR_MSG = (
+    "Something went wrong. If this issue persists, please contact "
+    "the **VoxStats Dev Team.** for more information."
+)
+
+
+async def report(interaction: Interaction, error: Exception) -> None:
+    """
+    Log an unexpected command error and show the generic failure message.
+
+    Using the logging module instead of print keeps error reporting off
+    the event loop's stdout hot path and preserves the traceback.
+
+    Args:
+        interaction (Interaction): The Discord interaction context.
+        error (Exception): The exception raised by the command.
+    """
+    logger.exception("handler failed", exc_info=error)
+    await interaction.edit_original_response(content=GENERIC_ERROR_MSG)
@@ -6,6 +6,7 @@ from .errors import (
     UnexpectedStatusError
 )
 from .request import *
+from .skins import *
 
 
 __all__ = [
@@ -0,0 +1,53 @@
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+from time import monotonic
+
+
+def async_ttl_cache(ttl_seconds: float, maxsize: int = 1024):
+    """
+    Memoize an async function with a per-entry TTL and LRU eviction.
+
+    Results are keyed by the call arguments; concurrent calls for the
+    same key share one in-flight execution through a per-key lock, so a
+    burst of identical requests costs a single upstream call.
+
+    Args:
+        ttl_seconds (float): How long a cached result stays valid.
+        maxsize (int, optional): Maximum number of cached entries; the
+            least recently used entry is evicted beyond this.
+            Defaults to 1024.
+
+    Returns:
+        Callable: Decorator wrapping an async function.
+    """
+    def decorator(func):
+        cache: OrderedDict = OrderedDict()
+        locks: dict = {}
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+
+            entry = cache.get(key)
+            if entry and entry[0] > monotonic():
+                cache.move_to_end(key)
+                return entry[1]
+
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = cache.get(key)
+                if entry and entry[0] > monotonic():
+                    return entry[1]
+
+                value = await func(*args, **kwargs)
+
+                cache[key] = (monotonic() + ttl_seconds, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    evicted, _ = cache.popitem(last=False)
+                    locks.pop(evicted, None)
+                return value
+
+        return wrapper
+    return decorator
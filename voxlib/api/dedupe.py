@@ -0,0 +1,197 @@
+import asyncio
+
+from aiohttp import ClientSession
+from mcfetch import Player
+
+from voxlib.constants import mojang_session
+
+from .cache import async_ttl_cache
+
+
+# Mojang profile data changes rarely; a few minutes of reuse is safe and
+# turns the common "same player in a burst of commands" case into a
+# single lookup. The TTL cache also coalesces concurrent resolutions of
+# the same key into one in-flight call.
+RESOLVE_CACHE_TTL = 300
+
+
+@async_ttl_cache(ttl_seconds=RESOLVE_CACHE_TTL, maxsize=4096)
+async def resolve_name(player: str) -> str | None:
+    """
+    Resolve a player's current name from their UUID (or IGN).
+
+    The blocking mcfetch lookup runs in a worker thread so the event
+    loop keeps serving interactions.
+
+    Args:
+        player (str): The player's UUID or in-game name.
+
+    Returns:
+        str | None: The player's current name, or None if not found.
+    """
+    return await asyncio.to_thread(
+        lambda: Player(player=player, requests_obj=mojang_session).name
+    )
+
+
+# Mojang's bulk byname endpoint accepts up to ten names per request.
+_BULK_LOOKUP_URL = (
+    "https://api.minecraftservices.com/minecraft/profile/lookup/bulk/byname"
+)
+BULK_BATCH_WINDOW = 0.02
+BULK_MAX_NAMES = 10
+
+
+class BulkUUIDResolver:
+    """
+    Micro-batches IGN-to-profile resolutions onto Mojang's bulk endpoint.
+
+    Lookups arriving within the batch window ride together in one POST
+    of up to BULK_MAX_NAMES names, so a burst of N validations (e.g. a
+    leaderboard render) costs ceil(N/10) round-trips instead of N.
+    """
+
+    def __init__(self):
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._session: ClientSession | None = None
+
+    def _get_session(self) -> ClientSession:
+        """
+        Get the long-lived session for the bulk endpoint, creating it
+        on first use.
+
+        Returns:
+            ClientSession: The shared session.
+        """
+        if self._session is None or self._session.closed:
+            self._session = ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the resolver's client session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def lookup(self, name: str) -> tuple[str, str] | None:
+        """
+        Resolve one in-game name, batched with concurrent lookups.
+
+        Args:
+            name (str): The player's in-game name.
+
+        Returns:
+            tuple[str, str] | None: The player's (uuid, canonical name),
+            or None if the name does not exist.
+        """
+        key = name.lower()
+        future = self._pending.get(key)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= BULK_MAX_NAMES:
+                self._spawn_flush()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    def _spawn_flush(self) -> None:
+        """
+        Start an immediate flush, holding a reference to the task so it
+        cannot be garbage-collected mid-flight.
+        """
+        task = asyncio.create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_after_window(self) -> None:
+        """
+        Flush whatever has accumulated once the batch window closes.
+        """
+        await asyncio.sleep(BULK_BATCH_WINDOW)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """
+        Resolve everything pending, one bulk request per chunk of at
+        most BULK_MAX_NAMES names. Lookups queued in the same event-loop
+        tick can outgrow the batch threshold before a flush task runs,
+        and Mojang rejects oversized requests outright.
+        """
+        batch, self._pending = self._pending, {}
+        names = list(batch)
+        for start in range(0, len(names), BULK_MAX_NAMES):
+            await self._post_batch({
+                name: batch[name]
+                for name in names[start:start + BULK_MAX_NAMES]
+            })
+
+    async def _post_batch(self, batch: dict[str, asyncio.Future]) -> None:
+        """
+        Send one bulk request for a chunk of names and resolve their
+        futures; names missing from the response resolve to None.
+        """
+        try:
+            session = self._get_session()
+            async with session.post(
+                _BULK_LOOKUP_URL, json=list(batch)
+            ) as response:
+                if response.status != 200:
+                    raise RuntimeError(
+                        f"Bulk lookup returned status {response.status}"
+                    )
+                profiles = await response.json()
+
+            for profile in profiles:
+                future = batch.pop(profile['name'].lower(), None)
+                if future is not None and not future.done():
+                    future.set_result((profile['id'], profile['name']))
+
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(None)
+
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+bulk_resolver = BulkUUIDResolver()
+
+
+@async_ttl_cache(ttl_seconds=RESOLVE_CACHE_TTL, maxsize=4096)
+async def resolve_profile(name: str) -> tuple[str, str] | None:
+    """
+    Resolve a player's (uuid, name) from their in-game name.
+
+    Goes through the bulk resolver so concurrent validations share
+    round-trips; falls back to a direct mcfetch lookup if the bulk
+    endpoint is unavailable.
+
+    Args:
+        name (str): The player's in-game name.
+
+    Returns:
+        tuple[str, str] | None: The player's (uuid, canonical name),
+        or None if the name does not exist.
+    """
+    try:
+        return await bulk_resolver.lookup(name)
+    except Exception:
+        pass
+
+    def fetch():
+        fetched = Player(player=name, requests_obj=mojang_session)
+        uuid = fetched.uuid
+        if uuid is None:
+            return None
+        return uuid, fetched.name
+
+    return await asyncio.to_thread(fetch)
@@ -1,7 +1,11 @@
+import string
 from enum import Enum
 
 
-class VoxylApiEndpoint(Enum):
+BASE_URL = "https://api.voxyl.net"
+
+
+class VoxylApiEndpoint(str, Enum):
     """
     Enumeration of all available Voxyl Network API endpoints.
 
@@ -25,4 +29,31 @@ class VoxylApiEndpoint(Enum):
     LEADERBOARD_GAME = "leaderboard/game/{ref}"
 
     DISCORD_FROM_PLAYER = "integration/discord_from_player/{uuid}"
-    PLAYER_FROM_DISCORD = "integration/player_from_discord/{discord_id}"
\ No newline at end of file
+    PLAYER_FROM_DISCORD = "integration/player_from_discord/{discord_id}"
+
+
+def _compile_builders() -> None:
+    """
+    Attach a compiled URL builder and path-parameter set to every
+    endpoint member.
+
+    Each template is parsed exactly once at import time and turned into
+    an f-string lambda over the fully qualified URL, so building a
+    request URL at runtime is plain string interpolation with no
+    format-string parsing or base-URL concatenation. Extra keyword
+    arguments (query parameters) are accepted and ignored, matching the
+    old `str.format`-based behaviour. `path_params` records which
+    keyword arguments belong in the path, so the request layer can route
+    the rest into the query string without a second parse.
+    """
+    formatter = string.Formatter()
+    for member in VoxylApiEndpoint:
+        template = f"{BASE_URL}/{member.value}"
+        fields = [field for _, field, _, _ in formatter.parse(template) if field]
+        args = "".join(f"{field}=None, " for field in fields)
+        member.template = template
+        member._build = eval(f"lambda {args}**_extra: f{template!r}")
+        member.path_params = frozenset(fields)
+
+
+_compile_builders()
\ No newline at end of file
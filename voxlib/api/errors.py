@@ -5,6 +5,8 @@ class APIError(Exception):
     Args:
         message (str): A descriptive error message.
     """
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message)
 
@@ -16,9 +18,14 @@ class RateLimitError(APIError):
     Args:
         message (str, optional): Custom error message.
             Defaults to "Rate limit exceeded".
+        retry_after (float, optional): Server-provided wait time in
+            seconds, taken from the Retry-After header when available.
     """
-    def __init__(self, message="Rate limit exceeded"):
+    __slots__ = ('retry_after',)
+
+    def __init__(self, message="Rate limit exceeded", retry_after: float = None):
         super().__init__(message)
+        self.retry_after = retry_after
 
 
 class BadRequestError(APIError):
@@ -30,6 +37,8 @@ class BadRequestError(APIError):
         message (str, optional): Custom error message.
             Defaults to "Bad request".
     """
+    __slots__ = ()
+
     def __init__(self, message="Bad request"):
         super().__init__(message)
 
@@ -42,5 +51,7 @@ class UnexpectedStatusError(APIError):
         message (str): A descriptive error message, typically including
             the unexpected status code or response content.
     """
+    __slots__ = ()
+
     def __init__(self, message):
         super().__init__(message)
\ No newline at end of file
@@ -1,15 +1,19 @@
 from .errors import *
-from .endpoints import VoxylApiEndpoint
+from .endpoints import BASE_URL, VoxylApiEndpoint
 import asyncio
+import random
+from collections import defaultdict
 from os import getenv
+from time import monotonic
+
+import orjson
 from aiohttp import (
     ClientError,
     ServerTimeoutError,
     ContentTypeError,
-    ClientSession
+    ClientSession,
+    TCPConnector
 )
-from typing import Literal
-from aiohttp import ClientTimeout
 from aiohttp.client_exceptions import InvalidURL, ClientConnectorError
 from aiohttp_client_cache import CachedSession, SQLiteBackend
 
@@ -23,9 +27,80 @@ voxyl_cache = SQLiteBackend(
     cache_name="voxlib/.cache/voxyl_cache", expire_after=300,
 )
 
-skin_session = SQLiteBackend(
-    cache_name=f'voxlib/.cache/skin_cache', expire_after=900
-)
+def _tune_sqlite_cache(db_path: str) -> None:
+    """
+    Switch an on-disk SQLite cache database to WAL journal mode.
+
+    The journal mode is the one tuning PRAGMA that persists in the
+    database file, so setting it once here carries over to every
+    connection the cache backends open later and lets cache reads
+    proceed concurrently with writes. Per-connection PRAGMAs would only
+    affect this throwaway connection, so none are applied. Safe to call
+    before the cache file exists; failures are ignored since the caches
+    also work untuned.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+    """
+    import sqlite3
+    try:
+        con = sqlite3.connect(db_path)
+        try:
+            con.execute("PRAGMA journal_mode=WAL")
+        finally:
+            con.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+for _cache_path in (
+    "voxlib/.cache/voxyl_cache",
+    "voxlib/.cache/skin_cache",
+    f"{getenv('DIR') or ''}voxlib/.cache/mojang_cache.sqlite",
+):
+    _tune_sqlite_cache(_cache_path)
+
+# In-process response cache TTLs (seconds). Leaderboards and the guild
+# top list change slowly, so they keep their entries longer than the
+# per-player endpoints.
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_MAXSIZE = 10_000
+
+# ETag revalidation state is useful past the response TTL, so it is
+# bounded by size rather than age; oldest entries are evicted first.
+ETAG_CACHE_MAXSIZE = 10_000
+
+ENDPOINT_CACHE_TTL = {
+    VoxylApiEndpoint.LEADERBOARD_NORMAL: 300,
+    VoxylApiEndpoint.LEADERBOARD_GAME: 300,
+    VoxylApiEndpoint.GUILD_TOP: 300,
+}
+
+# Client-side rate limiting: cap concurrent requests and smooth bursts
+# into a steady stream before they hit Voxyl's limiter.
+MAX_INFLIGHT_REQUESTS = 20
+RATE_LIMIT_RPS = 10
+RATE_LIMIT_BURST = 20
+
+# Retry backoff: exponential with full jitter, capped. Transient errors
+# retry quickly instead of stalling a command for a fixed 5s per attempt.
+RETRY_START_DELAY = 0.2
+RETRY_MAX_DELAY = 5.0
+RETRY_FACTOR = 2.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Compute the jittered exponential backoff delay for a retry attempt.
+
+    Args:
+        attempt (int): Zero-based index of the attempt that just failed.
+
+    Returns:
+        float: Seconds to sleep before the next attempt.
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_START_DELAY * RETRY_FACTOR ** attempt)
+    return delay * random.uniform(0.5, 1.0)
 
 
 class VoxylAPI:
@@ -41,22 +116,110 @@ class VoxylAPI:
             api_key (str, optional): API key for authenticating requests.
                 If not provided, defaults to the environment variable `API_KEY`.
         """
-        self.base_url: str = "https://api.voxyl.net"
+        self.base_url: str = BASE_URL
         self.api_key: str = api_key
+        self._sessions: dict = {}
+        self._response_cache: dict = {}
+        self._key_locks: defaultdict = defaultdict(asyncio.Lock)
+        self._etags: dict = {}
+        self._etag_payloads: dict = {}
+        self._inflight = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+        self._tokens: float = RATE_LIMIT_BURST
+        self._last_refill: float = monotonic()
+
+    async def _acquire_token(self) -> None:
+        """
+        Take one token from the rate-limit bucket, waiting for a refill
+        when the bucket is empty.
+
+        The bucket refills at RATE_LIMIT_RPS tokens per second up to
+        RATE_LIMIT_BURST, so request bursts are smoothed into a steady
+        stream instead of tripping the upstream rate limit.
+        """
+        while True:
+            now = monotonic()
+            self._tokens = min(
+                RATE_LIMIT_BURST,
+                self._tokens + (now - self._last_refill) * RATE_LIMIT_RPS
+            )
+            self._last_refill = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) / RATE_LIMIT_RPS)
+
+    def _get_session(
+        self,
+        cache: bool,
+        cached_session: SQLiteBackend
+    ) -> CachedSession:
+        """
+        Get the long-lived client session for a cache backend, creating it
+        on first use.
+
+        Reusing one session per backend keeps TCP connections alive between
+        requests, so repeat calls skip the DNS lookup and TLS handshake.
+        The connector keeps idle connections open for 75s (longer than the
+        gap between typical command bursts) and caches DNS answers for 5
+        minutes.
+
+        Args:
+            cache (bool): Whether the session should use a cache backend.
+            cached_session (SQLiteBackend): Cache backend for cached sessions.
+
+        Returns:
+            CachedSession: The shared session for this backend.
+        """
+        key = cached_session if cache else None
+        session = self._sessions.get(key)
+
+        if session is None or session.closed:
+            connector = TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            if cache:
+                session = CachedSession(cache=cached_session, connector=connector)
+            else:
+                session = CachedSession(connector=connector)
+            self._sessions[key] = session
+
+        return session
+
+    async def close(self) -> None:
+        """
+        Close all shared client sessions.
+
+        Should be called once on bot shutdown.
+        """
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
 
     async def _make_request(
         self,
         session: ClientSession | CachedSession,
         endpoint: VoxylApiEndpoint,
+        cache_key: tuple = None,
         **kwargs,
     ):
         """
         Internal helper that executes a single GET request to the Voxyl API.
 
+        When the previous response for `cache_key` carried an ETag, the
+        request is made conditional via `If-None-Match`; a 304 reply then
+        reuses the stored payload without any body download or parse.
+
         Args:
             session (aiohttp.ClientSession | aiohttp_client_cache.CachedSession):
                 Active session used to make the request.
             endpoint (VoxylApiEndpoint): Enum value representing the API route.
+            cache_key (tuple, optional): Response-cache key used to track ETags.
             **kwargs: Path variables to format into the endpoint, and extra query parameters.
 
         Raises:
@@ -68,29 +231,53 @@ class VoxylAPI:
             dict | str | None: Parsed JSON response if available, raw text if not JSON,
                 or None if the API returned HTTP 400.
         """
-        url: str = f"{self.base_url}/{endpoint.value.format(**kwargs)}"
+        url: str = endpoint._build(**kwargs)
         params: dict = {"api": self.api_key}
-        params.update({k: v for k, v in kwargs.items() if v is not None})
+        for key, value in kwargs.items():
+            if value is not None and key not in endpoint.path_params:
+                params[key] = value
+
+        headers = None
+        etag = self._etags.get(cache_key) if cache_key else None
+        if etag:
+            headers = {"If-None-Match": etag}
 
         try:
-            response = await session.get(url=url, params=params)
+            # The context manager releases the connection back to the pool
+            # as soon as the body has been read.
+            async with session.get(url=url, params=params, headers=headers) as response:
+                if response.status == 304 and cache_key in self._etag_payloads:
+                    return self._etag_payloads[cache_key]
 
-            try:
-                content = await response.json(content_type=None)
-            except Exception:
-                content = await response.text()
-
-            if response.status == 200:
-                return content
-            elif response.status == 400:
-                return None
-            elif response.status == 429:
-                raise RateLimitError(f"Rate limit exceeded: {content}")
-            else:
-                raise UnexpectedStatusError(
-                    f"Unexpected status {response.status}: {content}"
-                )
+                # Dispatch on Content-Type: one read, one decode path, and no
+                # exception machinery on the (common) non-JSON error bodies.
+                body = await response.read()
+                if 'json' in response.headers.get('Content-Type', ''):
+                    content = orjson.loads(body)
+                else:
+                    content = body.decode('utf-8', 'replace')
 
+                if response.status == 200:
+                    if cache_key:
+                        new_etag = response.headers.get('ETag')
+                        if new_etag:
+                            self._store_etag(cache_key, new_etag, content)
+                    return content
+                elif response.status == 400:
+                    return None
+                elif response.status == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    raise RateLimitError(
+                        f"Rate limit exceeded: {content}",
+                        retry_after=float(retry_after) if retry_after else None
+                    )
+                else:
+                    raise UnexpectedStatusError(
+                        f"Unexpected status {response.status}: {content}"
+                    )
+
+        except APIError:
+            raise
         except (ClientConnectorError, InvalidURL) as error:
             raise APIError(f"Connection error: {error}")
         except ServerTimeoutError:
@@ -108,7 +295,6 @@ class VoxylAPI:
         cache: bool = True,
         cached_session: SQLiteBackend = voxyl_cache,
         retries: int = 3,
-        retry_delay: int = 5,
         **kwargs,
     ):
         """
@@ -122,9 +308,7 @@ class VoxylAPI:
             cached_session (SQLiteBackend, optional): Cache backend to use if caching
                 is enabled. Defaults to `voxyl_cache` (5 min expiry).
             retries (int, optional): Number of retry attempts for transient failures.
-                Defaults to 3.
-            retry_delay (int, optional): Delay (in seconds) between retries.
-                Defaults to 5.
+                Each retry backs off exponentially with jitter. Defaults to 3.
             **kwargs: Path variables to format into the endpoint, and extra query parameters.
 
         Returns:
@@ -136,66 +320,179 @@ class VoxylAPI:
             UnexpectedStatusError: If the API returns an unexpected status code.
             APIError: For connection issues, invalid URLs, timeouts, or other client errors.
         """
-        for attempt in range(retries + 1):
+        if not cache:
+            return await self._request_with_retries(
+                endpoint, cache, cached_session, retries, **kwargs
+            )
+
+        key = (endpoint.value, tuple(sorted(kwargs.items())))
+        ttl = ENDPOINT_CACHE_TTL.get(endpoint, RESPONSE_CACHE_TTL)
+
+        cached = self._response_cache.get(key)
+        if cached and cached[0] > monotonic():
+            return cached[1]
+
+        # One lock per key: concurrent misses for the same endpoint+params
+        # coalesce into a single upstream request instead of a herd.
+        async with self._key_locks[key]:
+            cached = self._response_cache.get(key)
+            if cached and cached[0] > monotonic():
+                return cached[1]
+
             try:
-                if not cache:
-                    async with CachedSession() as session:
-                        return await self._make_request(session, endpoint, **kwargs)
-
-                async with CachedSession(cache=cached_session) as session:
-                    return await self._make_request(session, endpoint, **kwargs)
-
-            except APIError as exc:
-                if attempt < retries:
-                    print(
-                        f"[VoxylAPI] Request failed ({exc}). "
-                        f"Retrying in {retry_delay}s... [Attempt {attempt+1}/{retries}]"
-                    )
-                    await asyncio.sleep(retry_delay)
-                else:
-                    raise
+                content = await self._request_with_retries(
+                    endpoint, cache, cached_session, retries,
+                    cache_key=key, **kwargs
+                )
+            except RateLimitError:
+                if cached:
+                    return cached[1]
+                raise
 
-API = VoxylAPI()
+            if len(self._response_cache) >= RESPONSE_CACHE_MAXSIZE:
+                self._prune_response_cache()
+            self._response_cache[key] = (monotonic() + ttl, content)
+            return content
 
+    def _store_etag(self, cache_key: tuple, etag: str, content) -> None:
+        """
+        Record an endpoint's ETag and payload for revalidation, evicting
+        the least recently refreshed entry once the cap is reached.
 
-SkinStyle = Literal[
-    'face', 'front', 'frontfull', 'head',
-    'bust', 'full', 'skin', 'processedskin'
-]
+        Args:
+            cache_key (tuple): The response-cache key for the request.
+            etag (str): The ETag header from the 200 response.
+            content: The parsed response payload to serve on a 304.
+        """
+        self._etags.pop(cache_key, None)
+        self._etag_payloads.pop(cache_key, None)
+        while len(self._etags) >= ETAG_CACHE_MAXSIZE:
+            oldest = next(iter(self._etags))
+            del self._etags[oldest]
+            self._etag_payloads.pop(oldest, None)
+        self._etags[cache_key] = etag
+        self._etag_payloads[cache_key] = content
 
-DEFAULT_STEVE_SKIN_URL = (
-    "https://textures.minecraft.net/texture/"
-    "a4665d6a9c07b7b3ecf3b9f4b1c6bff0e43a9a3b65e5b4b94a3a4567d9a12345"
-)
+    def _prune_response_cache(self) -> None:
+        """
+        Drop expired entries (and their locks) from the response cache.
+        """
+        now = monotonic()
+        expired = [k for k, (expires, _) in self._response_cache.items() if expires <= now]
+        for key in expired:
+            del self._response_cache[key]
+            self._key_locks.pop(key, None)
+
+    async def _attempt(
+        self,
+        endpoint: VoxylApiEndpoint,
+        cache: bool,
+        cached_session: SQLiteBackend,
+        cache_key: tuple = None,
+        **kwargs,
+    ):
+        """
+        Execute a single request attempt under the concurrency limits.
 
-async def fetch_skin_model(
-    uuid: str,
-    style: SkinStyle = "full"
-) -> bytes:
-    
-    base_url = "https://visage.surgeplay.com"
-    headers = {
-        "User-Agent": "Vixel Stats Bot Version 1"
-    }
-    
-    timeout = ClientTimeout(total=5)
-    url = f"{base_url}/{style}/512/{uuid}"
+        Args:
+            endpoint (VoxylApiEndpoint): API endpoint enum value.
+            cache (bool): Whether to use a cached session.
+            cached_session (SQLiteBackend): Cache backend for cached sessions.
+            cache_key (tuple, optional): Response-cache key used to track ETags.
+            **kwargs: Path variables to format into the endpoint, and extra query parameters.
 
-    try:
-        async with CachedSession(cache=skin_session) as session:
-            res = await session.get(url, headers=headers, timeout=timeout)
-            if res.status == 200:
-                return await res.read()
-            else:
-                async with CachedSession(cache=skin_session) as fallback_session:
-                    fallback_res = await fallback_session.get(
-                        DEFAULT_STEVE_SKIN_URL, headers=headers, timeout=timeout
-                    )
-                    return await fallback_res.read()
+        Returns:
+            dict | str | None: The endpoint's response content.
+        """
+        async with self._inflight:
+            await self._acquire_token()
+            session = self._get_session(cache, cached_session)
+            return await self._make_request(
+                session, endpoint, cache_key=cache_key, **kwargs
+            )
+
+    async def _request_with_retries(
+        self,
+        endpoint: VoxylApiEndpoint,
+        cache: bool,
+        cached_session: SQLiteBackend,
+        retries: int,
+        cache_key: tuple = None,
+        **kwargs,
+    ):
+        """
+        Execute a request against the shared session, retrying transient failures.
+
+        The first attempt runs inline so the common no-retry case never
+        sets up the loop frame; failures fall through to `_retry_loop`.
+
+        Args:
+            endpoint (VoxylApiEndpoint): API endpoint enum value.
+            cache (bool): Whether to use a cached session.
+            cached_session (SQLiteBackend): Cache backend for cached sessions.
+            retries (int): Number of retry attempts for transient failures.
+            cache_key (tuple, optional): Response-cache key used to track ETags.
+            **kwargs: Path variables to format into the endpoint, and extra query parameters.
 
-    except Exception:
-        async with CachedSession(cache=skin_session) as fallback_session:
-            fallback_res = await fallback_session.get(
-                DEFAULT_STEVE_SKIN_URL, headers=headers, timeout=timeout
+        Returns:
+            dict | str | None: The endpoint's response content.
+        """
+        try:
+            return await self._attempt(
+                endpoint, cache, cached_session, cache_key, **kwargs
             )
-            return await fallback_res.read()
\ No newline at end of file
+        except RateLimitError as exc:
+            if retries < 1:
+                raise
+            await asyncio.sleep(exc.retry_after or _backoff_delay(0))
+        except APIError:
+            if retries < 1:
+                raise
+            await asyncio.sleep(_backoff_delay(0))
+
+        return await self._retry_loop(
+            endpoint, cache, cached_session, retries, cache_key, **kwargs
+        )
+
+    async def _retry_loop(
+        self,
+        endpoint: VoxylApiEndpoint,
+        cache: bool,
+        cached_session: SQLiteBackend,
+        retries: int,
+        cache_key: tuple = None,
+        **kwargs,
+    ):
+        """
+        Re-attempt a failed request with jittered exponential backoff.
+
+        Failed attempts back off exponentially with full jitter (capped at
+        RETRY_MAX_DELAY); a rate-limited attempt instead honours the
+        server's Retry-After value when one was provided.
+
+        Args:
+            endpoint (VoxylApiEndpoint): API endpoint enum value.
+            cache (bool): Whether to use a cached session.
+            cached_session (SQLiteBackend): Cache backend for cached sessions.
+            retries (int): Number of retry attempts for transient failures.
+            cache_key (tuple, optional): Response-cache key used to track ETags.
+            **kwargs: Path variables to format into the endpoint, and extra query parameters.
+
+        Returns:
+            dict | str | None: The endpoint's response content.
+        """
+        for attempt in range(1, retries + 1):
+            try:
+                return await self._attempt(
+                    endpoint, cache, cached_session, cache_key, **kwargs
+                )
+            except RateLimitError as exc:
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(exc.retry_after or _backoff_delay(attempt))
+            except APIError:
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+
+API = VoxylAPI()
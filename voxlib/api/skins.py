@@ -0,0 +1,58 @@
+"""Skin model fetching against the Visage rendering service."""
+
+from typing import Literal
+
+from aiohttp import ClientTimeout
+from aiohttp_client_cache import SQLiteBackend
+
+from .cache import async_ttl_cache
+from .request import API
+
+
+skin_session = SQLiteBackend(
+    cache_name=f'voxlib/.cache/skin_cache', expire_after=900
+)
+
+
+SkinStyle = Literal[
+    'face', 'front', 'frontfull', 'head',
+    'bust', 'full', 'skin', 'processedskin'
+]
+
+DEFAULT_STEVE_SKIN_URL = (
+    "https://textures.minecraft.net/texture/"
+    "a4665d6a9c07b7b3ecf3b9f4b1c6bff0e43a9a3b65e5b4b94a3a4567d9a12345"
+)
+
+# Skins change rarely; keep rendered models around for an hour so
+# repeat renders of the same player skip the download entirely.
+SKIN_MODEL_CACHE_TTL = 3600
+
+
+@async_ttl_cache(ttl_seconds=SKIN_MODEL_CACHE_TTL, maxsize=1024)
+async def fetch_skin_model(
+    uuid: str,
+    style: SkinStyle = "full"
+) -> bytes:
+    
+    base_url = "https://visage.surgeplay.com"
+    headers = {
+        "User-Agent": "Vixel Stats Bot Version 1"
+    }
+    
+    timeout = ClientTimeout(total=5)
+    url = f"{base_url}/{style}/512/{uuid}"
+
+    session = API._get_session(True, skin_session)
+
+    try:
+        async with session.get(url, headers=headers, timeout=timeout) as res:
+            if res.status == 200:
+                return await res.read()
+    except Exception:
+        pass
+
+    async with session.get(
+        DEFAULT_STEVE_SKIN_URL, headers=headers, timeout=timeout
+    ) as fallback_res:
+        return await fallback_res.read()
\ No newline at end of file
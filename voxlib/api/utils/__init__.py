@@ -1,12 +1,14 @@
-from .guild import GuildInfo
+from .guild import GuildInfo, GuildSnapshot
 from .integrate import IntegrationHelper
 from .leaderboard import LeaderboardInfo
-from .player import PlayerInfo
+from .player import PlayerInfo, PlayerSnapshot
 
 
 __all__ = [
     'GuildInfo',
+    'GuildSnapshot',
     'IntegrationHelper',
     'LeaderboardInfo',
-    'PlayerInfo'
+    'PlayerInfo',
+    'PlayerSnapshot'
 ]
\ No newline at end of file
@@ -1,14 +1,40 @@
+import asyncio
+from dataclasses import dataclass
 from typing import Any
 
 from voxlib.api import API, VoxylApiEndpoint
 
 
+@dataclass(slots=True, frozen=True)
+class GuildSnapshot:
+    """
+    Immutable snapshot of every guild field the bot renders.
+
+    Built once per command by :meth:`GuildInfo.snapshot`, so callers
+    that need several fields pay for a single batched fetch instead of
+    one request per attribute.
+    """
+    id: str | None
+    name: str | None
+    description: str | None
+    xp: int | None
+    member_count: int | None
+    owner_uuid: str | None
+    creation_time: int | None
+    members: list[dict[str, Any]] | None
+
+
 class GuildInfo:
     """
     Helper class for fetching and accessing guild-related data
     from the Voxyl Network API.
+
+    Each underlying API endpoint is only requested once per instance;
+    repeat attribute reads share the cached (or in-flight) response.
     """
 
+    __slots__ = ('_tag_or_id', '_fetch_cache')
+
     def __init__(self, tag_or_id: str):
         """
         Initialize a GuildInfo instance for a specific guild.
@@ -17,6 +43,31 @@ class GuildInfo:
             tag_or_id (str): The tag of the guild, or `-id` followed by the guild ID.
         """
         self._tag_or_id: str = tag_or_id
+        self._fetch_cache: dict[str, asyncio.Task] = {}
+
+    def _cached_request(
+        self,
+        key: str,
+        endpoint: VoxylApiEndpoint
+    ) -> asyncio.Task:
+        """
+        Get the memoized request task for an endpoint, creating it on first use.
+
+        Using a Task (instead of the raw coroutine) lets concurrent property
+        reads share a single in-flight request instead of racing.
+
+        Args:
+            key (str): Cache key identifying the endpoint.
+            endpoint (VoxylApiEndpoint): API endpoint enum value.
+
+        Returns:
+            asyncio.Task: Task resolving to the endpoint's JSON response.
+        """
+        if key not in self._fetch_cache:
+            self._fetch_cache[key] = asyncio.create_task(
+                API.make_request(endpoint, tag_or_id=self._tag_or_id)
+            )
+        return self._fetch_cache[key]
 
     async def fetch_guild_info(self) -> dict | None:
         """
@@ -25,10 +76,7 @@ class GuildInfo:
         Returns:
             dict | None: Guild info JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.GUILD_INFO,
-            tag_or_id=self._tag_or_id
-        )
+        data = await self._cached_request('info', VoxylApiEndpoint.GUILD_INFO)
         return data if data else None
 
     async def fetch_guild_members(self) -> dict | None:
@@ -38,12 +86,34 @@ class GuildInfo:
         Returns:
             dict | None: Guild members JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.GUILD_MEMBERS,
-            tag_or_id=self._tag_or_id
-        )
+        data = await self._cached_request('members', VoxylApiEndpoint.GUILD_MEMBERS)
         return data if data else None
 
+    async def snapshot(self) -> GuildSnapshot:
+        """
+        Fetch both guild endpoints concurrently and build a snapshot.
+
+        Returns:
+            GuildSnapshot: Immutable view of the guild's current data.
+        """
+        info, members = await asyncio.gather(
+            self.fetch_guild_info(),
+            self.fetch_guild_members(),
+        )
+        info = info or {}
+        members = members or {}
+
+        return GuildSnapshot(
+            id=info.get('id'),
+            name=info.get('name'),
+            description=info.get('desc'),
+            xp=info.get('xp'),
+            member_count=info.get('num'),
+            owner_uuid=info.get('ownerUUID'),
+            creation_time=info.get('time'),
+            members=members.get('members'),
+        )
+
     @staticmethod
     async def fetch_top_guilds(num: int = 10) -> dict | None:
         """
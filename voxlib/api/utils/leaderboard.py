@@ -1,7 +1,10 @@
+import asyncio
 from typing import Any
 
 from voxlib.api import API, VoxylApiEndpoint
 
+from .player import PlayerInfo
+
 
 class LeaderboardInfo:
     """
@@ -51,4 +54,41 @@ class LeaderboardInfo:
             ref=ref,
             period=period,
             type=type_
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    async def fetch_and_hydrate(
+        type_: str, num: int = 100, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the normal leaderboard and hydrate each row with player info.
+
+        The per-player info requests run concurrently in bounded waves
+        (instead of one sequential round-trip per row), so hydrating a
+        full leaderboard takes ~num/concurrency round-trips while staying
+        inside the Voxyl rate limits.
+
+        Args:
+            type_ (str): "weightedwins" or "level".
+            num (int, optional): Number of rows to retrieve (max 100).
+                Defaults to 100.
+            concurrency (int, optional): Maximum in-flight player info
+                requests. Defaults to 10.
+
+        Returns:
+            list[dict[str, Any]]: Leaderboard rows, each with the player's
+            info response attached under the "info" key.
+        """
+        data = await LeaderboardInfo.fetch_leaderboard(type_, num)
+        rows = data.get('players') if data else None
+        if not rows:
+            return []
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def hydrate(row: dict) -> dict:
+            async with semaphore:
+                info = await PlayerInfo(row['uuid']).fetch_player_info()
+            return {**row, 'info': info}
+
+        return list(await asyncio.gather(*(hydrate(row) for row in rows)))
\ No newline at end of file
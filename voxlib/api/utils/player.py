@@ -1,13 +1,67 @@
+import asyncio
+from dataclasses import dataclass
 from typing import Any
 
 from voxlib.api import API, VoxylApiEndpoint
+from voxlib.api.cache import async_ttl_cache
+
+
+# Fresh PlayerInfo instances are built for almost every command, so the
+# per-instance memo alone still pays one fetch per command. This layer
+# shares recent endpoint responses across instances for the same player.
+PLAYER_CACHE_TTL = 30
+
+
+@async_ttl_cache(ttl_seconds=PLAYER_CACHE_TTL, maxsize=2048)
+async def _fetch_endpoint(endpoint: VoxylApiEndpoint, uuid: str):
+    """
+    Fetch a player endpoint, TTL-cached across PlayerInfo instances.
+
+    Args:
+        endpoint (VoxylApiEndpoint): API endpoint enum value.
+        uuid (str): The UUID of the player.
+
+    Returns:
+        dict | str | None: The endpoint's response content.
+    """
+    return await API.make_request(endpoint, uuid=uuid)
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerSnapshot:
+    """
+    Immutable snapshot of every player field the bot renders.
+
+    Built once per command by :meth:`PlayerInfo.snapshot`, so callers
+    that need several fields pay for a single batched fetch instead of
+    one request per attribute.
+    """
+    last_login_name: str | None
+    last_login_time: int | None
+    role: str | None
+    level: int | None
+    exp: int | None
+    weightedwins: int | None
+    kills: int | None
+    wins: int | None
+    finals: int | None
+    beds: int | None
+    guild_role: str | None
+    guild_join_time: int | None
+    guild_id: str | None
 
 
 class PlayerInfo:
     """
     Helper class for fetching and accessing player-related data
     from the Voxyl Network API.
+
+    Each underlying API endpoint is only requested once per instance;
+    repeat attribute reads share the cached (or in-flight) response.
     """
+
+    __slots__ = ('_uuid', '_fetch_cache', '_totals_cache')
+
     def __init__(self, uuid: str):
         """
         Initialize a PlayerInfo instance for a specific player.
@@ -16,6 +70,32 @@ class PlayerInfo:
             uuid (str): The UUID of the player.
         """
         self._uuid: str = uuid
+        self._fetch_cache: dict[str, asyncio.Task] = {}
+        self._totals_cache: dict[str, int] | None = None
+
+    def _cached_request(
+        self,
+        key: str,
+        endpoint: VoxylApiEndpoint
+    ) -> asyncio.Task:
+        """
+        Get the memoized request task for an endpoint, creating it on first use.
+
+        Using a Task (instead of the raw coroutine) lets concurrent property
+        reads share a single in-flight request instead of racing.
+
+        Args:
+            key (str): Cache key identifying the endpoint.
+            endpoint (VoxylApiEndpoint): API endpoint enum value.
+
+        Returns:
+            asyncio.Task: Task resolving to the endpoint's JSON response.
+        """
+        if key not in self._fetch_cache:
+            self._fetch_cache[key] = asyncio.create_task(
+                _fetch_endpoint(endpoint, self._uuid)
+            )
+        return self._fetch_cache[key]
 
     async def fetch_player_info(self) -> dict | None:
         """
@@ -24,10 +104,7 @@ class PlayerInfo:
         Returns:
             dict | None: Player info JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.PLAYER_INFO,
-            uuid=self._uuid
-        )
+        data = await self._cached_request('info', VoxylApiEndpoint.PLAYER_INFO)
         return data if data else None
 
     async def fetch_overall_stats(self) -> dict | None:
@@ -37,10 +114,7 @@ class PlayerInfo:
         Returns:
             dict | None: Overall stats JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.PLAYER_OVERALL,
-            uuid=self._uuid
-        )
+        data = await self._cached_request('overall', VoxylApiEndpoint.PLAYER_OVERALL)
         return data if data else None
 
     async def fetch_game_stats(self) -> dict | None:
@@ -50,10 +124,7 @@ class PlayerInfo:
         Returns:
             dict | None: Game stats JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.PLAYER_STATS,
-            uuid=self._uuid
-        )
+        data = await self._cached_request('game', VoxylApiEndpoint.PLAYER_STATS)
         return data if data else None
 
     async def fetch_guild_info(self) -> dict | None:
@@ -63,12 +134,46 @@ class PlayerInfo:
         Returns:
             dict | None: Guild info JSON response, or None if not available.
         """
-        data = await API.make_request(
-            VoxylApiEndpoint.PLAYER_GUILD,
-            uuid=self._uuid
-        )
+        data = await self._cached_request('guild', VoxylApiEndpoint.PLAYER_GUILD)
         return data if data else None
 
+    async def snapshot(self) -> PlayerSnapshot:
+        """
+        Fetch every player endpoint concurrently and build a snapshot.
+
+        Prefer this over awaiting individual properties when several
+        fields are needed: all four endpoints are requested in one burst.
+
+        Returns:
+            PlayerSnapshot: Immutable view of the player's current data.
+        """
+        info, overall, totals, guild = await asyncio.gather(
+            self.fetch_player_info(),
+            self.fetch_overall_stats(),
+            self._totals(),
+            self.fetch_guild_info(),
+        )
+        info = info or {}
+        overall = overall or {}
+        totals = totals or {}
+        guild = guild or {}
+
+        return PlayerSnapshot(
+            last_login_name=info.get('lastLoginName'),
+            last_login_time=info.get('lastLoginTime'),
+            role=info.get('role'),
+            level=overall.get('level'),
+            exp=overall.get('exp'),
+            weightedwins=overall.get('weightedwins'),
+            kills=totals.get('kills'),
+            wins=totals.get('wins'),
+            finals=totals.get('finals'),
+            beds=totals.get('beds'),
+            guild_role=guild.get('guildRole'),
+            guild_join_time=guild.get('joinTime'),
+            guild_id=guild.get('guildId'),
+        )
+
     @property
     async def last_login_name(self) -> str | None:
         """
@@ -148,20 +253,46 @@ class PlayerInfo:
         game_stats = await self.fetch_game_stats()
         return game_stats.get('stats') if game_stats else None
 
-    @property
-    async def kills(self) -> int | None:
+    async def _totals(self) -> dict[str, int] | None:
         """
-        Get the total kills across all games.
+        Compute the total kills, wins, finals, and beds across all games.
+
+        The game stats payload is fetched once and all four sums are
+        accumulated in a single pass over it. The result is memoized on
+        the instance.
 
         Returns:
-            int | None: Sum of kills, or None if unavailable.
+            dict[str, int] | None: Totals keyed by stat name,
+            or None if unavailable.
         """
+        if self._totals_cache is not None:
+            return self._totals_cache
+
         game = await self.fetch_game_stats()
         if not game or 'stats' not in game:
             return None
 
         stats: dict[str, dict[str, Any]] = game['stats']
-        return sum(s.get('kills', 0) for s in stats.values())
+        totals = {'kills': 0, 'wins': 0, 'finals': 0, 'beds': 0}
+        for s in stats.values():
+            totals['kills'] += s.get('kills', 0)
+            totals['wins'] += s.get('wins', 0)
+            totals['finals'] += s.get('finals', 0)
+            totals['beds'] += s.get('beds', 0)
+
+        self._totals_cache = totals
+        return totals
+
+    @property
+    async def kills(self) -> int | None:
+        """
+        Get the total kills across all games.
+
+        Returns:
+            int | None: Sum of kills, or None if unavailable.
+        """
+        totals = await self._totals()
+        return totals['kills'] if totals else None
 
     @property
     async def wins(self) -> int | None:
@@ -171,12 +302,8 @@ class PlayerInfo:
         Returns:
             int | None: Sum of wins, or None if unavailable.
         """
-        game = await self.fetch_game_stats()
-        if not game or 'stats' not in game:
-            return None
-
-        stats: dict[str, dict[str, Any]] = game['stats']
-        return sum(s.get('wins', 0) for s in stats.values())
+        totals = await self._totals()
+        return totals['wins'] if totals else None
 
     @property
     async def finals(self) -> int | None:
@@ -186,12 +313,8 @@ class PlayerInfo:
         Returns:
             int | None: Sum of final kills, or None if unavailable.
         """
-        game = await self.fetch_game_stats()
-        if not game or 'stats' not in game:
-            return None
-
-        stats: dict[str, dict[str, Any]] = game['stats']
-        return sum(s.get('finals', 0) for s in stats.values())
+        totals = await self._totals()
+        return totals['finals'] if totals else None
 
     @property
     async def beds(self) -> int | None:
@@ -201,12 +324,8 @@ class PlayerInfo:
         Returns:
             int | None: Sum of beds broken, or None if unavailable.
         """
-        game = await self.fetch_game_stats()
-        if not game or 'stats' not in game:
-            return None
-
-        stats: dict[str, dict[str, Any]] = game['stats']
-        return sum(s.get('beds', 0) for s in stats.values())
+        totals = await self._totals()
+        return totals['beds'] if totals else None
 
     @property
     async def guild_role(self) -> str | None:
@@ -1,5 +1,7 @@
 import os
+import asyncio
 import functools
+import queue
 
 import pymysql
 from pymysql.cursors import Cursor
@@ -7,20 +9,23 @@ from pymysql.cursors import Cursor
 from dotenv import load_dotenv; load_dotenv()
 
 
+_DB_CREDS = (
+    os.getenv('DBUSER'),
+    os.getenv('DBPASS'),
+    os.getenv('DBNAME'),
+    os.getenv('DBENDPOINT'),
+)
+
+
 def _get_database_credentials() -> tuple[str, str, str, str]:
     """
-    Load database credentials from environment variables.
+    Get the database credentials resolved at import time.
 
     Returns:
         tuple[str, str, str, str]: A tuple containing
             (username, password, database name, endpoint).
     """
-    db_username = os.getenv('DBUSER')
-    db_password = os.getenv('DBPASS')
-    db_name = os.getenv('DBNAME')
-    db_endpoint = os.getenv('DBENDPOINT')
-    
-    return db_username, db_password, db_name, db_endpoint
+    return _DB_CREDS
 
 
 def db_connect():
@@ -43,12 +48,65 @@ def db_connect():
     return conn
 
 
+_POOL_MAXSIZE = 8
+
+
+class _ConnectionPool:
+    """
+    Small thread-safe pool of pymysql connections.
+
+    Opening a connection costs a TCP + MySQL auth handshake; pooling them
+    means repeat database calls reuse an already-authenticated connection.
+    Idle connections are pinged (with reconnect) on checkout so a dropped
+    server-side connection is replaced transparently.
+    """
+
+    def __init__(self, maxsize: int = _POOL_MAXSIZE):
+        self._idle: queue.Queue = queue.Queue(maxsize)
+
+    def acquire(self):
+        """
+        Get a healthy connection, reusing an idle one when available.
+
+        Returns:
+            pymysql.Connection: An open connection with autocommit enabled.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return db_connect()
+
+        try:
+            conn.ping(reconnect=True)
+        except pymysql.MySQLError:
+            return db_connect()
+        return conn
+
+    def release(self, conn) -> None:
+        """
+        Return a connection to the pool, closing it if the pool is full.
+
+        Args:
+            conn (pymysql.Connection): The connection to hand back.
+        """
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            try:
+                conn.close()
+            except pymysql.MySQLError:
+                pass
+
+
+_POOL = _ConnectionPool()
+
+
 def ensure_cursor(func):
     """
     Decorator to ensure a database cursor is available for a function.
 
     If a `cursor` argument is provided, it is reused.
-    Otherwise, a new connection and cursor are created for the function call.
+    Otherwise, a pooled connection and cursor are used for the function call.
 
     Args:
         func (Callable): A function that expects a `cursor` keyword argument.
@@ -62,11 +120,13 @@ def ensure_cursor(func):
         if cursor:
             return func(*args, **kwargs)
 
-        with db_connect() as conn:
-            conn.autocommit = True
+        conn = _POOL.acquire()
+        try:
             cursor = conn.cursor()
             kwargs['cursor'] = cursor
             return func(*args, **kwargs)
+        finally:
+            _POOL.release(conn)
 
     return wrapper
 
@@ -76,7 +136,9 @@ def async_ensure_cursor(func):
     Async decorator to ensure a database cursor is available for a coroutine.
 
     If a `cursor` argument is provided, it is reused.
-    Otherwise, a new connection and cursor are created for the coroutine call.
+    Otherwise, a pooled connection and cursor are used for the coroutine call.
+    The blocking acquire and release calls run in a worker thread so the
+    event loop is never stalled on database I/O.
 
     Args:
         func (Coroutine): An async function that expects a `cursor` keyword argument.
@@ -90,10 +152,12 @@ def async_ensure_cursor(func):
         if cursor:
             return await func(*args, **kwargs)
 
-        with db_connect() as conn:
-            conn.autocommit = True
+        conn = await asyncio.to_thread(_POOL.acquire)
+        try:
             cursor = conn.cursor()
             kwargs['cursor'] = cursor
             return await func(*args, **kwargs)
+        finally:
+            await asyncio.to_thread(_POOL.release, conn)
 
     return wrapper
\ No newline at end of file
@@ -0,0 +1,18 @@
+-- Indexes for the tables VoxStats queries on every command.
+--
+-- All Linking / Sessions queries filter by discord_id or by
+-- (uuid, session_id); without these keys MySQL falls back to a full
+-- table scan that grows linearly with user count. The unique keys also
+-- back the INSERT ... ON DUPLICATE KEY UPDATE upserts in
+-- voxlib/database/utils.
+
+-- discord_id stays the sole unique key on linked: the upsert in
+-- Linking.link_player must match on the Discord user so re-linking a
+-- uuid that moved to a different account overwrites cleanly.
+ALTER TABLE linked
+    ADD UNIQUE KEY ux_linked_discord_id (discord_id);
+
+-- The leftmost prefix (uuid) of this key also covers
+-- Sessions.get_active_sessions, so no separate uuid index is needed.
+ALTER TABLE sessions
+    ADD UNIQUE KEY ux_sessions_uuid_session (uuid, session_id);
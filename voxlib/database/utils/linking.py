@@ -1,7 +1,16 @@
+from time import monotonic
 from typing import Optional
+
 from voxlib.database import ensure_cursor, Cursor
 
 
+# Link rows change only through link_player / unlink_player, so reads
+# can be served from memory between writes. Entries expire after the
+# TTL in case another process rewrites the table.
+_LINK_CACHE_TTL = 300
+_link_cache: dict[int, tuple[float, Optional[tuple]]] = {}
+
+
 class Linking:
     """
     Manages linking between a Discord user ID and a player UUID in the database.
@@ -17,7 +26,7 @@ class Linking:
         self._discord_id = discord_id
 
     @ensure_cursor
-    def get_linked_player(self, *, cursor: Cursor = None) -> Optional[dict]:
+    def get_linked_player(self, *, cursor: Cursor = None) -> Optional[tuple]:
         """
         Retrieve the player UUID linked to this Discord user, if any.
 
@@ -26,17 +35,20 @@ class Linking:
                 a new connection and cursor are created automatically.
 
         Returns:
-            Optional[dict]: A dictionary representing the linked record
-            (containing Discord ID and player UUID), or None if no link exists.
+            Optional[tuple]: A one-element row containing the linked player
+            UUID, or None if no link exists.
         """
+        cached = _link_cache.get(self._discord_id)
+        if cached and cached[0] > monotonic():
+            return cached[1]
+
         cursor.execute(
-            "SELECT * FROM linked WHERE discord_id = %s", (self._discord_id,)
+            "SELECT uuid FROM linked WHERE discord_id = %s", (self._discord_id,)
         )
-        linked_data = cursor.fetchone()
+        linked_data = cursor.fetchone() or None
 
-        if linked_data:
-            return linked_data
-        return None
+        _link_cache[self._discord_id] = (monotonic() + _LINK_CACHE_TTL, linked_data)
+        return linked_data
 
     @ensure_cursor
     def link_player(self, uuid: str, *, cursor: Cursor = None) -> None:
@@ -50,20 +62,13 @@ class Linking:
                 a new connection and cursor are created automatically.
         """
         cursor.execute(
-            "SELECT * FROM linked WHERE discord_id=%s", (self._discord_id,)
+            """
+            INSERT INTO linked (discord_id, uuid) VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE uuid=VALUES(uuid)
+            """,
+            (self._discord_id, uuid),
         )
-        linked_data = cursor.fetchone()
-
-        if not linked_data:
-            cursor.execute(
-                "INSERT INTO linked (discord_id, uuid) VALUES (%s, %s)",
-                (self._discord_id, uuid),
-            )
-        else:
-            cursor.execute(
-                "UPDATE linked SET uuid=%s WHERE discord_id=%s",
-                (uuid, self._discord_id),
-            )
+        _link_cache[self._discord_id] = (monotonic() + _LINK_CACHE_TTL, (uuid,))
 
     @ensure_cursor
     def unlink_player(self, *, cursor: Cursor = None) -> None:
@@ -77,3 +82,4 @@ class Linking:
         cursor.execute(
             "DELETE FROM linked WHERE discord_id=%s", (self._discord_id,)
         )
+        _link_cache[self._discord_id] = (monotonic() + _LINK_CACHE_TTL, None)
@@ -1,12 +1,24 @@
+import asyncio
+from time import monotonic
 from typing import Optional, Tuple
 
-from voxlib.database import ensure_cursor, async_ensure_cursor, Cursor
+from voxlib.database import async_ensure_cursor, Cursor
 from voxlib.api.utils import PlayerInfo
 
 
+# start_date only changes when a session is created, reset, or ended —
+# all of which invalidate the entry — so repeat reads (every session
+# render) skip MySQL entirely.
+_START_DATE_CACHE_TTL = 300
+_start_date_cache: dict[tuple, tuple[float, Optional[str]]] = {}
+
+
 class Sessions:
     """
     Represents a player's game session on the Voxyl network.
+
+    All database access is asynchronous; the blocking query execution
+    runs in a worker thread so the event loop keeps serving interactions.
     """
 
     def __init__(self, uuid: str, session_id: int = None) -> None:
@@ -20,8 +32,8 @@ class Sessions:
         self._uuid = uuid
         self._session_id = session_id
 
-    @ensure_cursor
-    def get_session(self, *, cursor: Cursor = None) -> Optional[Tuple]:
+    @async_ensure_cursor
+    async def get_session(self, *, cursor: Cursor = None) -> Optional[Tuple]:
         """
         Retrieve a session record for the player.
 
@@ -29,10 +41,15 @@ class Sessions:
             cursor (Cursor, optional): Active database cursor. Defaults to None.
 
         Returns:
-            Optional[Tuple]: A tuple containing session data if found, otherwise None.
+            Optional[Tuple]: The session's (wins, weighted, kills, finals,
+            beds, star, xp, start_date) row if found, otherwise None.
         """
-        cursor.execute(
-            "SELECT * FROM sessions WHERE uuid=%s AND session_id=%s",
+        await asyncio.to_thread(
+            cursor.execute,
+            """
+            SELECT wins, weighted, kills, finals, beds, star, xp, start_date
+            FROM sessions WHERE uuid=%s AND session_id=%s
+            """,
             (self._uuid, self._session_id)
         )
         result = cursor.fetchone()
@@ -41,77 +58,68 @@ class Sessions:
     @async_ensure_cursor
     async def create_session(self, *, cursor: Cursor = None) -> None:
         """
-        Create a new session record for the player in the database.
+        Create or refresh a session record for the player in the database.
 
-        Player statistics are fetched from the Voxyl API and stored with
-        the current timestamp as the session start time.
+        Player statistics are fetched from the Voxyl API concurrently and
+        stored with the current timestamp as the session start time. An
+        existing session with the same (uuid, session_id) is overwritten
+        in the same statement, so callers never need a lookup first.
 
         Args:
             cursor (Cursor, optional): Active database cursor. Defaults to None.
         """
         player = PlayerInfo(self._uuid)
-        cursor.execute(
+        wins, weighted, kills, finals, beds, star, xp = await asyncio.gather(
+            player.wins, player.weightedwins, player.kills, player.finals,
+            player.beds, player.level, player.exp,
+        )
+        await asyncio.to_thread(
+            cursor.execute,
             """
             INSERT INTO sessions (
                 uuid, wins, weighted, kills, finals, beds, star, xp, start_date, session_id
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)
+            ON DUPLICATE KEY UPDATE
+                wins=VALUES(wins), weighted=VALUES(weighted), kills=VALUES(kills),
+                finals=VALUES(finals), beds=VALUES(beds), star=VALUES(star),
+                xp=VALUES(xp), start_date=NOW()
             """, (
-                self._uuid,
-                await player.wins,
-                await player.weightedwins,
-                await player.kills,
-                await player.finals,
-                await player.beds,
-                await player.level,
-                await player.exp,
+                self._uuid, wins, weighted, kills, finals, beds, star, xp,
                 self._session_id,
             )
         )
+        _start_date_cache.pop((self._uuid, self._session_id), None)
 
     @async_ensure_cursor
     async def reset_session(self, *, cursor: Cursor = None) -> None:
         """
-        Reset (update) an existing session with the player's latest statistics.
+        Reset an existing session with the player's latest statistics.
 
-        The session start time is also updated to the current timestamp.
+        Same upsert as :meth:`create_session`; kept as a separate method
+        for readability at the call sites.
 
         Args:
             cursor (Cursor, optional): Active database cursor. Defaults to None.
         """
-        player = PlayerInfo(self._uuid)
-        cursor.execute(
-            """
-            UPDATE sessions
-            SET wins=%s, weighted=%s, kills=%s, finals=%s, beds=%s, star=%s, xp=%s, start_date=NOW()
-            WHERE uuid=%s AND session_id=%s
-            """, (
-                await player.wins,
-                await player.weightedwins,
-                await player.kills,
-                await player.finals,
-                await player.beds,
-                await player.level,
-                await player.exp,
-                self._uuid,
-                self._session_id,
-            )
-        )
+        await self.create_session(cursor=cursor)
 
-    @ensure_cursor
-    def end_session(self, *, cursor: Cursor = None) -> None:
+    @async_ensure_cursor
+    async def end_session(self, *, cursor: Cursor = None) -> None:
         """
         Delete a session record from the database.
 
         Args:
             cursor (Cursor, optional): Active database cursor. Defaults to None.
         """
-        cursor.execute(
+        await asyncio.to_thread(
+            cursor.execute,
             "DELETE FROM sessions WHERE uuid=%s AND session_id=%s",
             (self._uuid, self._session_id)
         )
+        _start_date_cache.pop((self._uuid, self._session_id), None)
 
-    @ensure_cursor
-    def get_active_sessions(self, *, cursor: Cursor = None) -> Optional[Tuple]:
+    @async_ensure_cursor
+    async def get_active_sessions(self, *, cursor: Cursor = None) -> Optional[Tuple]:
         """
         Fetch all active session IDs for the player.
 
@@ -121,15 +129,16 @@ class Sessions:
         Returns:
             Optional[Tuple]: A tuple of session IDs if found, otherwise None.
         """
-        cursor.execute(
+        await asyncio.to_thread(
+            cursor.execute,
             "SELECT session_id FROM sessions WHERE uuid=%s",
             (self._uuid,)
         )
         result = cursor.fetchall()
         return result if result else None
 
-    @ensure_cursor
-    def get_start_date(self, *, cursor: Cursor = None) -> Optional[str]:
+    @async_ensure_cursor
+    async def get_start_date(self, *, cursor: Cursor = None) -> Optional[str]:
         """
         Get the start date of a specific session.
 
@@ -139,9 +148,18 @@ class Sessions:
         Returns:
             Optional[str]: The session start timestamp as a string if found, otherwise None.
         """
-        cursor.execute(
+        key = (self._uuid, self._session_id)
+        cached = _start_date_cache.get(key)
+        if cached and cached[0] > monotonic():
+            return cached[1]
+
+        await asyncio.to_thread(
+            cursor.execute,
             "SELECT start_date FROM sessions WHERE uuid=%s AND session_id=%s",
             (self._uuid, self._session_id)
         )
         result = cursor.fetchone()
-        return result[0] if result else None
+        start_date = result[0] if result else None
+
+        _start_date_cache[key] = (monotonic() + _START_DATE_CACHE_TTL, start_date)
+        return start_date
@@ -1,9 +1,29 @@
-from mcfetch import Player
+import asyncio
+
 from discord import Interaction, Embed
 
 from voxlib.api.utils import IntegrationHelper, PlayerInfo
+from voxlib.api.dedupe import resolve_name
 from voxlib.database.utils import Linking
-from voxlib import check_if_valid_ign, COLOR_RED, mojang_session
+from voxlib import check_if_valid_ign, COLOR_RED
+
+
+# The integration walkthrough has no dynamic fields, so the embed is
+# built once instead of on every failed /link.
+_NOT_INTEGRATED_EMBED = Embed(
+    title="Player Not Integrated To Voxyl Network!", color=COLOR_RED,
+    description=(
+        f"To successfully link your account, please ensure that you're using the correct ign and Discord that's integrated to the Voxyl Network.\n\n"
+        f"**Follow the steps below to integrate to the Voxyl Network.**\n"
+        f"- ` 1. ` Join the official Bedwars Practice Discord [here](https://discord.gg/7Mt7T8hqr4).\n"
+        f"- ` 2. ` Go to the following channel https://discord.com/channels/703935026282233946/735838687526518874.\n"
+        f"- ` 3. ` Launch Minecraft and join `sync.voxyl.net`. \n"
+        f"- ` 4. ` Copy the Integration Code shown on screen. *Do NOT share this code!*\n"
+        f"- ` 5. ` Go back to https://discord.com/channels/703935026282233946/735838687526518874\n  - ` 5.1 ` Use `;integrate <ign> <integration-code>`.\n"
+        f"- ` 6. ` You're now integrated to the Voxyl Network.\n"
+        f"- ` 7. ` After the integration run `/link <ign>` again.\n"
+    )
+)
 
 
 async def link_interaction(
@@ -23,37 +43,29 @@ async def link_interaction(
     try:
         linked_player = Linking(interaction.user.id).get_linked_player()
         if linked_player:
-            ign = Player(player=linked_player[1], requests_obj=mojang_session).name
+            ign = await resolve_name(linked_player[0])
             return await interaction.edit_original_response(
                 content=f"You are already linked as **{ign}**. Want to unlink? Run `/unlink`"
             )
         
-        uuid = await check_if_valid_ign(interaction, player)
-        if not uuid:
+        resolved = await check_if_valid_ign(interaction, player)
+        if not resolved:
             return None
+        uuid, name = resolved
                 
         integration = IntegrationHelper()
-        get_uuid = await integration.get_player_uuid_from_discord(interaction.user.id)
-        get_id = await integration.get_discord_id_from_player(uuid)
+        get_uuid, get_id = await asyncio.gather(
+            integration.get_player_uuid_from_discord(interaction.user.id),
+            integration.get_discord_id_from_player(uuid),
+        )
 
         if None in (get_uuid, get_id):
-            embed = Embed(
-                title="Player Not Integrated To Voxyl Network!", color=COLOR_RED,
-                description=(
-                    f"To successfully link your account, please ensure that you're using the correct ign and Discord that's integrated to the Voxyl Network.\n\n"
-                    f"**Follow the steps below to integrate to the Voxyl Network.**\n"
-                    f"- ` 1. ` Join the official Bedwars Practice Discord [here](https://discord.gg/7Mt7T8hqr4).\n"
-                    f"- ` 2. ` Go to the following channel https://discord.com/channels/703935026282233946/735838687526518874.\n"
-                    f"- ` 3. ` Launch Minecraft and join `sync.voxyl.net`. \n"
-                    f"- ` 4. ` Copy the Integration Code shown on screen. *Do NOT share this code!*\n"
-                    f"- ` 5. ` Go back to https://discord.com/channels/703935026282233946/735838687526518874\n  - ` 5.1 ` Use `;integrate <ign> <integration-code>`.\n"
-                    f"- ` 6. ` You're now integrated to the Voxyl Network.\n"
-                    f"- ` 7. ` After the integration run `/link <ign>` again.\n"
-                )
-            )
-            return await interaction.edit_original_response(embed=embed)            
+            return await interaction.edit_original_response(embed=_NOT_INTEGRATED_EMBED)
         else:
-            name = Player(player=get_uuid, requests_obj=mojang_session).name
+            # The validated IGN already names this player; only resolve
+            # again if the integration points at a different account.
+            if str(get_uuid).replace('-', '') != uuid.replace('-', ''):
+                name = await resolve_name(get_uuid)
 
             if interaction.user.id == get_id:
                 uuid = str(get_uuid).replace('-', '')
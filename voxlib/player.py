@@ -1,10 +1,24 @@
+import asyncio
+import logging
+import re
 from typing import Optional
+
+import requests
+from aiohttp import ClientError
 from discord import Interaction
-from mcfetch import Player
 
 from voxlib.database.utils import Linking
+from voxlib.api.errors import APIError
 from voxlib.api.utils import PlayerInfo
-from voxlib import mojang_session
+from voxlib.api.dedupe import resolve_name, resolve_profile
+
+
+logger = logging.getLogger(__name__)
+
+
+# Minecraft IGNs are 3-16 characters from [A-Za-z0-9_]; anything else
+# can be rejected without a Mojang round-trip.
+_VALID_IGN = re.compile(r"^[A-Za-z0-9_]{3,16}$")
 
 
 async def check_if_ever_played(
@@ -56,7 +70,7 @@ async def check_if_linked(
         linked = Linking(interaction.user.id).get_linked_player()
 
         if linked:
-            player = Player(player=linked[1], requests_obj=mojang_session).name
+            player = await resolve_name(linked[0])
 
         if not player:
             await interaction.edit_original_response(
@@ -90,7 +104,7 @@ async def check_if_linked_discord(
         await interaction.edit_original_response(content=message)
         return None
 
-    return linked[1]
+    return linked[0]
 
 
 async def not_exist_message(interaction: Interaction, player: str):
@@ -113,26 +127,49 @@ async def not_exist_message(interaction: Interaction, player: str):
 async def check_if_valid_ign(
     interaction: Interaction,
     player: str
-) -> Optional[str]:
+) -> Optional[tuple[str, str]]:
     """
     Validate that a given player IGN exists and resolve it to a UUID.
 
+    Both the UUID and the canonical name come from the same Mojang
+    profile response, so callers that need the display name afterwards
+    don't have to resolve the player a second time.
+
     Args:
         interaction (Interaction): The Discord interaction context.
         player (str): The player's in-game name (IGN).
 
     Returns:
-        Optional[str]: The player's UUID if valid, otherwise None.
+        Optional[tuple[str, str]]: The player's (uuid, name) if valid,
+        otherwise None.
     """
-    if len(player) > 16:
+    if _VALID_IGN.match(player) is None:
         return await not_exist_message(interaction, player)
 
-    uuid = Player(player=player, requests_obj=mojang_session).uuid
-
-    if uuid is None:
+    profile = await resolve_profile(player)
+    if profile is None:
         return await not_exist_message(interaction, player)
 
-    return uuid
+    return profile
+
+
+async def _warm_player_cache(uuid: str) -> None:
+    """
+    Prefetch the stats endpoints downstream renders read.
+
+    Fills the shared player TTL cache so the render that follows a
+    successful fetch_player hits memory instead of the API. Failures
+    are ignored; the render path does its own error handling.
+
+    Args:
+        uuid (str): The UUID of the player.
+    """
+    player = PlayerInfo(uuid)
+    await asyncio.gather(
+        player.fetch_overall_stats(),
+        player.fetch_game_stats(),
+        return_exceptions=True,
+    )
 
 
 async def fetch_player(
@@ -153,15 +190,23 @@ async def fetch_player(
     try:
         if not (player := await check_if_linked(interaction, player)):
             return None
-        if not (uuid := await check_if_valid_ign(interaction, player)):
+        if not (resolved := await check_if_valid_ign(interaction, player)):
             return None
-        if not await check_if_ever_played(interaction, uuid):
+        uuid, _ = resolved
+        # Warm the stats cache while the played-before gate runs; both
+        # only cost one burst of concurrent requests.
+        played, _ = await asyncio.gather(
+            check_if_ever_played(interaction, uuid),
+            _warm_player_cache(uuid),
+        )
+        if not played:
             return None
 
         return uuid
 
-    except Exception as error:
-        print(error)
+    except (APIError, ClientError, asyncio.TimeoutError,
+            requests.RequestException) as error:
+        logger.warning("fetch_player failed: %s", error)
         await interaction.edit_original_response(
             content=(
                 "The API is currently down. If this issue persists, please contact "
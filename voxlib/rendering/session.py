@@ -1,61 +1,98 @@
+import asyncio
+from functools import lru_cache
+from io import BytesIO
+
 from mctextrender import BackgroundImageLoader, ImageRender
 
 from voxlib.api.utils import PlayerInfo
 from voxlib.database.utils import Sessions
 from voxlib import DIR, get_xp_and_stars, started_on
 
+from voxlib.api.dedupe import resolve_name
+
 from .utils import get_displayname, get_progress_bar, render_skin
 
 
-async def render_session(uuid: str, session: int) -> None:
+# Static heading/label rows never change between renders, so the tuples
+# and option dicts are built once at import instead of per call.
+_SHADOW_OPTS = {"shadow_offset": (2, 2)}
+
+
+@lru_cache(maxsize=8)
+def _load_base(path: str):
+    """
+    Load and RGBA-convert a static background, decoded once per path.
+
+    Callers must .copy() the result before drawing on it.
+
+    Args:
+        path (str): Filesystem path of the background image.
+
+    Returns:
+        Image.Image: The decoded RGBA base image.
+    """
+    return BackgroundImageLoader(path).load_image(path).convert("RGBA")
+
+_STATIC_LABELS = (
+    ('&fWins', {'position': (404, 185), "align": "center", "font_size": 16}),
+    ('&fWeighted Wins', {'position': (649, 185), "align": "center", "font_size": 16}),
+
+    ('&fFinal Kills', {'position': (363, 265), "align": "center", "font_size": 16}),
+    ('&fKills', {'position': (526, 265), "align": "center", "font_size": 16}),
+    ('&fBeds Broken', {'position': (690, 265), "align": "center", "font_size": 16}),
+
+    ('&fLevels Gained', {'position': (404, 340), "align": "center", "font_size": 16}),
+    ('&fEXP Gained', {'position': (649, 340), "align": "center", "font_size": 16}),
+
+    ('&fBWP Stats (Overall)', {'position': (631, 138), "align": "center", "font_size": 14}),
+)
+
+
+async def render_session(uuid: str, session: int) -> BytesIO | None:
     path = f"{DIR}assets/bg/sessions/base.png"
-    bg = BackgroundImageLoader(path)
-    base_img = bg.load_image(path).convert("RGBA")
-    im = ImageRender(base_img)
+    im = ImageRender(_load_base(path).copy())
 
     player = PlayerInfo(uuid)
 
-    session_data = Sessions(uuid, session).get_session()
+    session_data = await Sessions(uuid, session).get_session()
     if not session_data:
         return None
 
-    im.text.draw_many([
-        (f'&fWins', {'position': (404, 185), "align": "center", "font_size": 16}),
-        (f'&fWeighted Wins', {'position': (649, 185), "align": "center", "font_size": 16}),
+    im.text.draw_many(_STATIC_LABELS, _SHADOW_OPTS)
+
+    # One burst: every awaited input is fetched concurrently, and the
+    # display helpers run as plain functions on the results.
+    (
+        cur_wins, cur_weighted, cur_kills, cur_finals, cur_beds,
+        level, exp, role, name,
+    ) = await asyncio.gather(
+        player.wins, player.weightedwins, player.kills,
+        player.finals, player.beds, player.level, player.exp,
+        player.role, resolve_name(uuid),
+    )
 
-        (f'&fFinal Kills', {'position': (363, 265), "align": "center", "font_size": 16}),
-        (f'&fKills', {'position': (526, 265), "align": "center", "font_size": 16}),
-        (f'&fBeds Broken', {'position': (690, 265), "align": "center", "font_size": 16}),
+    display_name = get_displayname(name, role)
+    parts = get_progress_bar(level, exp)
 
-        (f'&fLevels Gained', {'position': (404, 340), "align": "center", "font_size": 16}),
-        (f'&fEXP Gained', {'position': (649, 340), "align": "center", "font_size": 16}),
-        
-        (f'&fBWP Stats (Overall)', {'position': (631, 138), "align": "center", "font_size": 14}),
-        (f'&fSession &8(&7#{session}&8)', {'position': (386, 138), "align": "center", "font_size": 14}),
-    ],
-        {"shadow_offset": (2, 2)} 
-    )
+    wins = int(cur_wins - session_data[0])
+    weighted = int(cur_weighted - session_data[1])
+    kills = int(cur_kills - session_data[2])
+    finals = int(cur_finals - session_data[3])
+    beds = int(cur_beds - session_data[4])
 
-    wins = int(await player.wins - session_data[2])
-    weighted = int(await player.weightedwins - session_data[3]) 
-    kills = int(await player.kills - session_data[4]) 
-    finals = int(await player.finals - session_data[5])
-    beds = int(await player.beds - session_data[6])
-
-    exp_gained, stars_gained = await get_xp_and_stars(
-        old_level = session_data[7],
-        old_xp = session_data[8],
-        new_level = await player.level,
-        new_xp = await player.exp
+    exp_gained, stars_gained = get_xp_and_stars(
+        old_level = session_data[5],
+        old_xp = session_data[6],
+        new_level = level,
+        new_xp = exp
     )
 
-    display_name = await get_displayname(uuid)
-    parts = await get_progress_bar(uuid)
+    started = started_on(session_data[7])
 
-    started = started_on(session_data[9])
 
+    im.text.draw_many((
+        (f'&fSession &8(&7#{session}&8)', {'position': (386, 138), "align": "center", "font_size": 14}),
 
-    im.text.draw_many([
         (f'&a{wins:,}', {'position': (404, 207), "align": "center", "font_size": 20}),
         (f'&9{weighted:,}', {'position': (649, 207), "align": "center", "font_size": 20}),
 
@@ -73,8 +110,8 @@ async def render_session(uuid: str, session: int) -> None:
         (f'{parts[2]}',  {'position': (609, 413), 'align': 'left',  'font_size': 16}),
 
         (f'Started {started}',  {'position': (526, 98), 'align': 'center',  'font_size': 14}),
-    ],
-        {"shadow_offset": (2, 2)} 
+    ),
+        _SHADOW_OPTS
     )
 
     await render_skin(
@@ -84,4 +121,7 @@ async def render_session(uuid: str, session: int) -> None:
         size=(204, 374),
         style='full'
     )
-    im.save(f"{DIR}assets/stats/session.png")
\ No newline at end of file
+    buffer = BytesIO()
+    im._image.save(buffer, format="PNG")
+    buffer.seek(0)
+    return buffer
\ No newline at end of file
@@ -1,14 +1,71 @@
+from bisect import bisect_right
+from functools import lru_cache
+
 from PIL import Image, UnidentifiedImageError
 from mctextrender import ImageRender
 from typing import List
-from mcfetch import Player
 from io import BytesIO
 
-from voxlib import mojang_session, get_xp_for_level
-from voxlib.api.utils import PlayerInfo
+from voxlib import get_xp_for_level
+from voxlib.api.cache import async_ttl_cache
 from voxlib.api import fetch_skin_model
 
 
+# Matches the skin-model TTL: on a hit the whole decode/convert/resize
+# chain is skipped, not just the download.
+SKIN_IMAGE_CACHE_TTL = 3600
+
+
+@async_ttl_cache(ttl_seconds=SKIN_IMAGE_CACHE_TTL, maxsize=256)
+async def _get_resized_skin(
+    uuid: str,
+    style: str,
+    size: tuple[int, int]
+) -> Image.Image:
+    """
+    Fetch, decode, and resize a player's skin model, cached per
+    (uuid, style, size).
+
+    Args:
+        uuid (str): The player's UUID.
+        style (str): Skin style ("full", etc.).
+        size (tuple[int, int]): (width, height) of the resized skin.
+
+    Returns:
+        Image.Image: The resized RGBA skin image.
+    """
+    skin_data = await fetch_skin_model(uuid, style)
+    skin = Image.open(BytesIO(skin_data))
+
+    # Resize before converting so the conversion works on the target
+    # pixel count, not the full-resolution source. Palette images are
+    # converted first since resampling them directly loses quality.
+    if skin.mode == "P":
+        skin = skin.convert("RGBA")
+    skin = skin.resize(size, Image.Resampling.LANCZOS)
+    if skin.mode != "RGBA":
+        skin = skin.convert("RGBA")
+    return skin
+
+
+_ROLE_PREFIXES = {
+    "Owner": "&c[Owner] ",
+    "Admin": "&c[Admin] ",
+    "Manager": "&4[Manager] ",
+    "Dev": "&a[Dev] ",
+    "HeadBuilder": "&5[HeadBuilder] ",
+    "Builder": "&d[Builder] ",
+    "SrMod": "&e[SrMod] ",
+    "Mod": "&e[Mod] ",
+    "Trainee": "&a[Trainee] ",
+    "Youtube": "&c[&fYoutube&c] ",
+    "Master": "&6[Master] ",
+    "Expert": "&9[Expert] ",
+    "Adept": "&2[Adept] ",
+    "Legend": "&6[Leg&een&fd&6] ",
+}
+
+
 def get_role_prefix(role: str) -> str:
     """
     Return the formatted chat prefix for a given role.
@@ -19,47 +76,31 @@ def get_role_prefix(role: str) -> str:
     Returns:
         str: The color-coded role prefix, or a default gray code if the role is unknown.
     """
-    role_prefixes = {
-        "Owner": "&c[Owner] ",
-        "Admin": "&c[Admin] ",
-        "Manager": "&4[Manager] ",
-        "Dev": "&a[Dev] ",
-        "HeadBuilder": "&5[HeadBuilder] ",
-        "Builder": "&d[Builder] ",
-        "SrMod": "&e[SrMod] ",
-        "Mod": "&e[Mod] ",
-        "Trainee": "&a[Trainee] ",
-        "Youtube": "&c[&fYoutube&c] ",
-        "Master": "&6[Master] ",
-        "Expert": "&9[Expert] ",
-        "Adept": "&2[Adept] ",
-        "Legend": "&6[Leg&een&fd&6] ",
-    }
-    return role_prefixes.get(role, "&7")
+    return _ROLE_PREFIXES.get(role, "&7")
 
 
-async def get_displayname(uuid: str) -> str:
+@lru_cache(maxsize=1024)
+def get_displayname(name: str, role: str) -> str:
     """
     Build a player's display name including role prefix and special Legend styling.
 
+    Pure string work on already-fetched values; callers resolve the name
+    and role (concurrently with their other fetches) and pass them in.
+    Results are memoized since a player's name and role rarely change
+    within a session.
+
     Args:
-        uuid (str): The player's UUID.
+        name (str): The player's current name.
+        role (str): The player's role.
 
     Returns:
         str: The formatted display name with role prefix and color codes.
     """
-    player = PlayerInfo(uuid)
-
-    role = await player.role
-    name = Player(player=uuid, requests_obj=mojang_session).name
-
     if role == "Legend":
         if len(name) >= 3:
-            name = '&6' + name[:-3] + '&e' + name[-3:-1] + '&f' + name[-1]
-        elif len(name) == 2:
-            name = '&6' + name[0] + '&6' + name[1]
-        elif len(name) == 1:
-            name = '&6' + name
+            name = f"&6{name[:-3]}&e{name[-3:-1]}&f{name[-1]}"
+        elif name:
+            name = f"&6{name}"
 
     rank = get_role_prefix(role)
 
@@ -94,6 +135,14 @@ class PrestigeColorMaps:
     )
 
 
+
+# Ascending parallel tuples over the prestige map, materialized once so
+# the badge lookup is a bisect over precomputed arrays.
+_PRESTIGE_THRESHOLDS, _PRESTIGE_COLORS = zip(
+    *sorted(PrestigeColorMaps.prestige_map.items())
+)
+
+
 bedwars_star_symbol_map = {
     3100: '✥',
     2100: '⚝',
@@ -115,6 +164,31 @@ def get_star_symbol(level: int) -> str:
     return '✫'
 
 
+@lru_cache(maxsize=16384)
+def _prestige_color(level: int) -> str:
+    """
+    Build the color-coded badge for a validated integer level.
+
+    Memoized: there are only ~10k distinct levels, so repeat renders of
+    the same badge are a cache hit instead of string assembly.
+
+    Args:
+        level (int): The player's level.
+
+    Returns:
+        str: The color-coded level string, e.g., "&6[123✫]".
+    """
+    level_str = f"[{level}{get_star_symbol(level)}]"
+
+    if 0 <= level < 1000:
+        color = _PRESTIGE_COLORS[bisect_right(_PRESTIGE_THRESHOLDS, level) - 1]
+        # Every char gets the same prefix, so one join does it.
+        return f"{color}{color.join(level_str)}"
+
+    color = PrestigeColorMaps.prestige_1000_colors
+    return ''.join([f"{color[i % len(color)]}{char}" for i, char in enumerate(level_str)])
+
+
 def get_prestige_color(level: int) -> str:
     """
     Render a level badge with prestige-based color codes.
@@ -135,38 +209,34 @@ def get_prestige_color(level: int) -> str:
         raise TypeError(
             f"Expected an integer for level, but got {type(level)}")
 
-    c = PrestigeColorMaps
-    level_str = f"[{level}{get_star_symbol(level)}]"
-
-    if level < 1000:
-        for threshold in sorted(c.prestige_map.keys(), reverse=True):
-            if level >= threshold:
-                color = c.prestige_map[threshold]
-                return ''.join([f"{color}{char}" for char in level_str])
-
-    color = c.prestige_1000_colors
-    return ''.join([f"{color[i % len(color)]}{char}" for i, char in enumerate(level_str)])
+    return _prestige_color(level)
 
 
 def get_prestige_color_level(level: int) -> str:
     """
     Convenience wrapper to return the prestige-colored level badge.
 
+    Internal callers always pass an int, so this skips the public
+    wrapper's dict/type validation.
+
     Args:
         level (int): The player's level.
 
     Returns:
         str: The color-coded level string.
     """
-    return get_prestige_color(level)
+    return _prestige_color(level)
 
 
-async def get_progress_bar(uuid: str) -> List[str]:
+def get_progress_bar(level: int, xp: int) -> List[str]:
     """
     Build a progress bar line showing current level, XP progress, and next level.
 
+    Pure arithmetic and string work on already-fetched values.
+
     Args:
-        uuid (str): The player's UUID.
+        level (int): The player's current level.
+        xp (int): The player's XP progress within the current level.
 
     Returns:
         List[str]: A three-part list containing the left badge, the bar, and the right badge.
@@ -174,11 +244,6 @@ async def get_progress_bar(uuid: str) -> List[str]:
     progress_symbol = "⏹"
     progress_bar_max = 10
 
-    player = PlayerInfo(uuid)
-
-    level = await player.level
-    xp = await player.exp
-
     xp_needed = get_xp_for_level(level)
 
     if xp is None or xp <= 0 or xp_needed is None:
@@ -225,10 +290,8 @@ async def render_skin(
         style (str): Skin style ("full", etc.).
     """
     try:
-        skin_data = await fetch_skin_model(uuid, style)
-        skin_model = BytesIO(skin_data)
-        skin = Image.open(skin_model).convert("RGBA").resize(size)
+        skin = await _get_resized_skin(uuid, style, size)
 
-        image.paste(skin, position, mask=skin.split()[3])
+        image.paste(skin, position, mask=skin.getchannel("A"))
     except (UnidentifiedImageError, Exception) as error:
         print("render_skin error:", error)
@@ -1,13 +1,31 @@
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from bisect import bisect_right
+from datetime import datetime
 
-from .xp_map import get_xp_for_level
+from .xp_map import get_cumulative_xp
 
 
-async def get_total_xp(level: int, partial_xp: int = 0) -> int:
+# Bucket boundaries (seconds) and the unit each bucket is counted in.
+# Month/year use average lengths; the "X ago" label doesn't need
+# calendar-exact arithmetic.
+_AGO_BOUNDS = (60, 3600, 86400, 604800, 2629800, 31557600)
+_AGO_UNITS = (
+    (1, 'sec'),
+    (60, 'min'),
+    (3600, 'hr'),
+    (86400, 'day'),
+    (604800, 'week'),
+    (2629800, 'month'),
+    (31557600, 'year'),
+)
+
+
+def get_total_xp(level: int, partial_xp: int = 0) -> int:
     """
     Calculate the total XP a player has accumulated up to a given level.
 
+    Pure arithmetic on the precomputed prefix sums — no I/O, so it is
+    a plain synchronous function.
+
     Args:
         level (int): The players current level.
         partial_xp (int, optional): XP progress within the current level.
@@ -16,15 +34,10 @@ async def get_total_xp(level: int, partial_xp: int = 0) -> int:
     Returns:
         int: The total accumulated XP.
     """
-    total_xp = 0
-    for lvl in range(1, level):
-        total_xp += get_xp_for_level(lvl)
+    return get_cumulative_xp(level) + partial_xp
 
-    total_xp += partial_xp
-    return total_xp
 
-
-async def get_xp_and_stars(
+def get_xp_and_stars(
     old_level: int,
     old_xp: int,
     new_level: int,
@@ -34,7 +47,8 @@ async def get_xp_and_stars(
     Calculate how much XP and how many stars a player gained
     between two points in time.
 
-    Stars are awarded at a fixed rate of 5000 XP per star.
+    Stars are awarded at a fixed rate of 5000 XP per star. Pure
+    arithmetic on the prefix sums, so it is a plain function.
 
     Args:
         old_level (int): The players previous level.
@@ -47,8 +61,8 @@ async def get_xp_and_stars(
             - Total XP gained (int)
             - Stars gained (float, rounded to 2 decimals)
     """
-    old = await get_total_xp(old_level, old_xp)
-    new = await get_total_xp(new_level, new_xp)
+    old = get_total_xp(old_level, old_xp)
+    new = get_total_xp(new_level, new_xp)
 
     xp_gained = new - old
     stars_gained = round(xp_gained / 5000, 2)
@@ -63,6 +77,8 @@ def started_on(date_input) -> str:
     The function takes a datetime object or a string representing a datetime in the format 
     ``"%Y-%m-%d %H:%M:%S"``. It calculates how long ago that date was relative to the current time, 
     and returns a string with the formatted date and a human-readable "time ago" expression.
+    String parsing uses ``datetime.fromisoformat``, whose C fast path
+    accepts that format directly.
 
     Args:
         date_input (datetime | str): A datetime object or a string in the format 
@@ -75,26 +91,12 @@ def started_on(date_input) -> str:
     if isinstance(date_input, datetime):
         past = date_input
     else:
-        past = datetime.strptime(str(date_input), "%Y-%m-%d %H:%M:%S")
-
-    now = datetime.now()
-    delta = relativedelta(now, past)
-
-    if delta.years:
-        ago = f"{delta.years} year{'s' if delta.years > 1 else ''} ago"
-    elif delta.months:
-        ago = f"{delta.months} month{'s' if delta.months > 1 else ''} ago"
-    elif delta.days >= 7:
-        weeks = delta.days // 7
-        ago = f"{weeks} week{'s' if weeks > 1 else ''} ago"
-    elif delta.days:
-        ago = f"{delta.days} day{'s' if delta.days > 1 else ''} ago"
-    elif delta.hours:
-        ago = f"{delta.hours} hr{'s' if delta.hours > 1 else ''} ago"
-    elif delta.minutes:
-        ago = f"{delta.minutes} min{'s' if delta.minutes > 1 else ''} ago"
-    else:
-        ago = f"{delta.seconds} sec{'s' if delta.seconds > 1 else ''} ago"
+        past = datetime.fromisoformat(str(date_input))
+
+    seconds = max((datetime.now() - past).total_seconds(), 0)
+    unit_seconds, label = _AGO_UNITS[bisect_right(_AGO_BOUNDS, seconds)]
+    count = int(seconds // unit_seconds)
+    ago = f"{count} {label}{'s' if count > 1 else ''} ago"
 
     date_formatted = past.strftime("%d/%m/%Y")
     return f"{date_formatted} ({ago})"
\ No newline at end of file
@@ -1,6 +1,14 @@
-def get_xp_for_level(level: int) -> int:
+from itertools import accumulate
+
+
+_TABLE_SIZE = 10_000
+
+
+def _compute_xp_for_level(level: int) -> int:
     """
-    Calculate the XP required to reach a given level.
+    Compute the XP required to progress from a level using the block/cycle rules.
+
+    Only used to build the lookup table at import time.
 
     Args:
         level (int): The players level.
@@ -17,30 +25,60 @@ def get_xp_for_level(level: int) -> int:
         4: 5000
     }
 
-    block = level // 100
-
     if level % 100 in cycle:
         return cycle[level % 100]
 
-    if block == 0:
-        return 5000
-    elif block == 1:
-        return 5500
-    elif block == 2:
-        return 6000
-    elif block == 3:
-        return 6500
-    elif block == 4:
-        return 7000
-    elif block == 5:
-        return 7500
-    elif block == 6:
-        return 8000
-    elif block == 7:
-        return 8500
-    elif block == 8:
-        return 9000
-    elif block == 9:
-        return 9500
-    else:
-        return 10000
+    block = level // 100
+    if block < 10:
+        return 5000 + block * 500
+    return 10000
+
+
+_XP_TABLE = tuple(_compute_xp_for_level(level) for level in range(_TABLE_SIZE))
+
+
+def get_xp_for_level(level: int) -> int:
+    """
+    Get the XP required to reach a given level.
+
+    Served from a table precomputed at import, so each call is a single
+    indexed load instead of the branchy block/cycle computation. Levels
+    beyond the table fall back to computing the rules directly.
+
+    Args:
+        level (int): The players level.
+
+    Returns:
+        int: The amount of XP required to progress from this level
+             to the next.
+    """
+    if 0 <= level < _TABLE_SIZE:
+        return _XP_TABLE[level]
+    return _compute_xp_for_level(level)
+
+
+_CUM_XP = tuple(accumulate(_XP_TABLE, initial=0))
+
+
+def get_cumulative_xp(level: int) -> int:
+    """
+    Get the total XP required to climb from level 1 to a given level.
+
+    Served from a prefix-sum table built at import, turning the old
+    O(level) summation loop into a single subtraction.
+
+    Args:
+        level (int): The players current level.
+
+    Returns:
+        int: The accumulated XP across levels 1 through ``level - 1``.
+    """
+    if level <= 1:
+        return 0
+    if level <= _TABLE_SIZE:
+        return _CUM_XP[level] - _CUM_XP[1]
+
+    total = _CUM_XP[_TABLE_SIZE] - _CUM_XP[1]
+    for lvl in range(_TABLE_SIZE, level):
+        total += _compute_xp_for_level(lvl)
+    return total